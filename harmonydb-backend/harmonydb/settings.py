@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Full-text search (SearchVector/SearchRank)
     "users",
     "songs",
     "meloai",  # Add the AI assistant app
@@ -75,7 +76,8 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWTAuthentication with the token->user lookup served from Redis
+        "users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
 }
@@ -111,6 +113,11 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", EMAIL_HOST_USER)
 FRONTEND_BASE_URL = os.getenv("FRONTEND_BASE_URL", "http://localhost:5173")  # used in email links
 BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
 
+# Serve audio via nginx X-Accel-Redirect (requires an internal
+# "location /protected/ { internal; alias <MEDIA_ROOT>/; }" block);
+# off by default so the dev server streams files itself
+AUDIO_X_ACCEL_REDIRECT = os.getenv("AUDIO_X_ACCEL_REDIRECT", "false").lower() == "true"
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -129,6 +136,51 @@ TEMPLATES = [
 WSGI_APPLICATION = 'harmonydb.wsgi.application'
 
 
+# Celery (background jobs: matview refreshes, emails)
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://127.0.0.1:6379/0')
+# Ack after completion and fetch one task at a time so an email batch
+# drains through a single reused SMTP connection per worker
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_BEAT_SCHEDULE = {
+    'flush-listening-history': {
+        'task': 'songs.tasks.flush_listening_history',
+        'schedule': 2,  # drain the Redis play-event buffer
+    },
+    'refresh-popular-and-recent-playlists': {
+        'task': 'songs.tasks.refresh_popular_and_recent_playlists',
+        'schedule': 300,  # every 5 minutes
+    },
+    'resync-playlist-rollups': {
+        'task': 'songs.tasks.resync_playlist_rollups',
+        'schedule': 3600,  # hourly; signals handle membership changes
+    },
+    'resync-artist-counters': {
+        'task': 'songs.tasks.resync_artist_counters',
+        'schedule': 3600,  # hourly; signals handle inserts/deletes
+    },
+    'refresh-popular-songs': {
+        'task': 'songs.tasks.refresh_popular_songs',
+        'schedule': 300,  # every 5 minutes
+    },
+    'refresh-monthly-genre-trends': {
+        'task': 'songs.tasks.refresh_monthly_genre_trends',
+        'schedule': 3600,  # hourly
+    },
+}
+
+
+# Cache (Redis)
+# Used for hot read endpoints (advanced search, analytics blocks)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+    }
+}
+
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -60,16 +60,11 @@ class SQLAnalytics:
         from django.contrib.auth import get_user_model
         User = get_user_model()
 
-        # Complex query with multiple joins and subqueries
+        # Song/album counts and play totals come from the denormalized
+        # User counters; only the engagement aggregates still join
         artists = User.objects.filter(
             role='artist'
         ).annotate(
-            # Count of songs
-            total_songs=Count('songs', distinct=True),
-            # Count of albums  
-            total_albums=Count('albums', distinct=True),
-            # Total plays across all songs
-            total_plays=Sum('songs__play_count'),
             # Favorites count (subquery)
             favorites_count=Count(
                 'songs__favorite',
@@ -81,13 +76,15 @@ class SQLAnalytics:
             # Count of comments on their songs
             comments_count=Count('songs__comment', distinct=True)
         ).filter(
-            total_songs__gt=0
-        ).order_by('-total_plays')[:20]
+            cached_song_count__gt=0
+        ).order_by('-cached_total_plays')[:20]
 
         return list(artists.values(
-            'id', 'username', 'stage_name', 'total_songs', 
-            'total_albums', 'total_plays', 'favorites_count',
-            'avg_song_duration', 'comments_count'
+            'id', 'username', 'stage_name', 'favorites_count',
+            'avg_song_duration', 'comments_count',
+            total_songs=F('cached_song_count'),
+            total_albums=F('cached_album_count'),
+            total_plays=F('cached_total_plays'),
         ))
 
     @staticmethod
@@ -197,7 +194,7 @@ class SQLAnalytics:
         Demonstrates: BETWEEN clause, Range filtering
         Returns songs within duration range
         """
-        queryset = Song.objects.select_related('artist', 'genre')
+        queryset = Song.objects.select_related('artist', 'album', 'genre')
 
         if min_duration and max_duration:
             # BETWEEN clause
@@ -271,11 +268,10 @@ class SQLAnalytics:
         Demonstrates: Many-to-Many aggregations, Complex JOINs
         Returns playlist statistics
         """
+        # song_count / total_duration / total_plays are denormalized columns
+        # on Playlist (maintained by signals), so only the favorite and
+        # genre-diversity metrics still aggregate here
         playlists = Playlist.objects.select_related('user').annotate(
-            # Number of songs
-            song_count=Count('playlist_songs__song', distinct=True),
-            # Total duration
-            total_duration=Sum('playlist_songs__song__duration'),
             # Number of favorites
             favorites_count=Count(
                 'favorite',
@@ -283,9 +279,7 @@ class SQLAnalytics:
                 distinct=True
             ),
             # Unique genres in playlist
-            unique_genres=Count('playlist_songs__song__genre', distinct=True),
-            # Total plays of songs in playlist
-            total_plays=Sum('playlist_songs__song__play_count')
+            unique_genres=Count('playlist_songs__song__genre', distinct=True)
         ).filter(
             is_public=True,
             song_count__gt=0
@@ -350,8 +344,9 @@ class SQLAnalytics:
         try:
             song = Song.objects.get(id=song_id)
 
-            # Find similar songs (same genre or artist, but not the same song)
-            similar = Song.objects.filter(
+            # Find similar songs (same genre or artist, but not the same song).
+            # select_related keeps SongSerializer from issuing a query per row
+            similar = Song.objects.select_related('artist', 'album', 'genre').filter(
                 Q(genre=song.genre) | Q(artist=song.artist)
             ).exclude(
                 id=song_id
@@ -427,9 +422,10 @@ class SQLAnalytics:
         Demonstrates: Date filtering, Aggregations, Complex ordering
         Get trending songs based on recent activity
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
+        # DB-side NOW() keeps the generated SQL text stable for plan caching
+        cutoff_date = Now() - timedelta(days=days)
 
-        trending = Song.objects.annotate(
+        trending = Song.objects.select_related('artist', 'album', 'genre').annotate(
             # Recent listens
             recent_listens=Count(
                 'listening_history',
@@ -465,7 +461,9 @@ class SQLAnalytics:
         Demonstrates: Raw SQL with JOINs, Subqueries, CTEs
         Complex statistics using raw SQL for maximum flexibility
         """
-        with connection.cursor() as cursor:
+        from .views import dict_cursor
+
+        with dict_cursor() as cursor:
             # Example 1: CTE with multiple aggregations
             query = """
             WITH song_stats AS (
@@ -521,7 +519,7 @@ class SQLAnalytics:
         ).values_list('song_id', flat=True)
 
         # Recommend songs from favorite genres/artists that user hasn't heard
-        recommendations = Song.objects.filter(
+        recommendations = Song.objects.select_related('artist', 'album', 'genre').filter(
             Q(genre_id__in=user_genres) | Q(artist_id__in=user_artists)
         ).exclude(
             id__in=listened_songs
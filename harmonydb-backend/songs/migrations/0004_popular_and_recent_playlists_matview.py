@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0003_album_search_vector_playlist_search_vector_and_more'),
+    ]
+
+    operations = [
+        # Materialized snapshot of the popular/recent playlist UNION that
+        # PlaylistListCreateView previously recomputed on every list call.
+        # Refreshed concurrently every few minutes by a Celery beat task.
+        migrations.RunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW popular_and_recent_playlists AS
+                SELECT 'popular' as category, p.id as playlist_id, p.name, u.username,
+                       COUNT(f.id) as favorites
+                FROM songs_playlist p
+                INNER JOIN users_user u ON p.user_id = u.id
+                LEFT JOIN songs_favorite f ON p.id = f.item_id AND f.item_type = 'playlist'
+                GROUP BY p.id, p.name, u.username
+                HAVING COUNT(f.id) >= 3
+
+                UNION
+
+                SELECT 'recent' as category, p.id as playlist_id, p.name, u.username,
+                       0 as favorites
+                FROM songs_playlist p
+                INNER JOIN users_user u ON p.user_id = u.id
+                WHERE p.created_at >= NOW() - INTERVAL '7 days';
+
+                CREATE UNIQUE INDEX popular_recent_playlists_uniq
+                ON popular_and_recent_playlists (category, playlist_id);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS popular_and_recent_playlists;",
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0004_popular_and_recent_playlists_matview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playlist',
+            name='playlist_type',
+            field=models.CharField(db_index=True, default='mini', max_length=8),
+        ),
+        # Backfill from current song counts (new/empty playlists keep 'mini')
+        migrations.RunSQL(
+            sql="""
+                UPDATE songs_playlist p
+                SET playlist_type = CASE
+                    WHEN c.ct >= 100 THEN 'mega'
+                    WHEN c.ct >= 50 THEN 'large'
+                    WHEN c.ct >= 20 THEN 'medium'
+                    WHEN c.ct >= 5 THEN 'small'
+                    ELSE 'mini'
+                END
+                FROM (
+                    SELECT playlist_id, COUNT(*) AS ct
+                    FROM songs_playlistsong
+                    GROUP BY playlist_id
+                ) c
+                WHERE c.playlist_id = p.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0005_playlist_playlist_type'),
+    ]
+
+    operations = [
+        # Monthly listen aggregates only move slowly, so GenreAnalyticsView
+        # reads them from this matview instead of scanning the whole
+        # listening-history table. Refreshed hourly by Celery beat.
+        migrations.RunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW mv_monthly_genre_trends AS
+                SELECT date_trunc('month', lh.listened_at) AS month,
+                       g.name AS genre_name,
+                       COUNT(*) AS listen_count
+                FROM songs_listeninghistory lh
+                INNER JOIN songs_song s ON s.id = lh.song_id
+                LEFT JOIN songs_genre g ON g.id = s.genre_id
+                GROUP BY 1, 2;
+
+                CREATE UNIQUE INDEX monthly_genre_trends_uniq
+                ON mv_monthly_genre_trends (month, genre_name);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS mv_monthly_genre_trends;",
+        ),
+    ]
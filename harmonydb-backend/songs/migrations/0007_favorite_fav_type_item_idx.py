@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0006_monthly_genre_trends_matview'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favorite',
+            index=models.Index(fields=['item_type', 'item_id'], name='fav_type_item_idx'),
+        ),
+    ]
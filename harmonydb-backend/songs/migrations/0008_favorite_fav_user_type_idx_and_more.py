@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0007_favorite_fav_type_item_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favorite',
+            index=models.Index(fields=['user', 'item_type'], name='fav_user_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listeninghistory',
+            index=models.Index(fields=['listened_at', 'song'], name='lh_listened_song_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playlistsong',
+            index=models.Index(fields=['playlist', 'added_at'], name='ps_playlist_added_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(fields=['genre', '-play_count'], name='song_genre_plays_idx'),
+        ),
+    ]
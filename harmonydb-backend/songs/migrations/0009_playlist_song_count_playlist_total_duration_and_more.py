@@ -0,0 +1,48 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0008_favorite_fav_user_type_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playlist',
+            name='song_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='playlist',
+            name='total_duration',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='playlist',
+            name='total_plays',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        # Backfill the rollups from the current playlist contents
+        migrations.RunSQL(
+            sql="""
+                UPDATE songs_playlist p
+                SET song_count = c.ct,
+                    total_duration = COALESCE(c.dur, 0),
+                    total_plays = COALESCE(c.plays, 0)
+                FROM (
+                    SELECT ps.playlist_id,
+                           COUNT(*) AS ct,
+                           SUM(s.duration) AS dur,
+                           SUM(s.play_count) AS plays
+                    FROM songs_playlistsong ps
+                    INNER JOIN songs_song s ON s.id = ps.song_id
+                    GROUP BY ps.playlist_id
+                ) c
+                WHERE c.playlist_id = p.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Trigram GIN indexes for the columns the unified search filters with
+    ILIKE '%query%'. Leading-wildcard ILIKE cannot use B-tree indexes, so
+    without these every search request sequentially scans each table;
+    with gin_trgm_ops the planner serves the same ILIKE from the index.
+    Indexes are created CONCURRENTLY (hence atomic = False) to avoid
+    locking the tables out of writes while they build.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('songs', '0009_playlist_song_count_playlist_total_duration_and_more'),
+        ('users', '0002_user_bio_user_birth_date_user_created_at_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_song_title_trgm "
+                "ON songs_song USING gin (title gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS songs_song_title_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_album_title_trgm "
+                "ON songs_album USING gin (title gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS songs_album_title_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS songs_playlist_name_trgm "
+                "ON songs_playlist USING gin (name gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS songs_playlist_name_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS users_user_username_trgm "
+                "ON users_user USING gin (username gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS users_user_username_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS users_user_stage_name_trgm "
+                "ON users_user USING gin (stage_name gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS users_user_stage_name_trgm;",
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0010_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='listeninghistory',
+            index=models.Index(fields=['user', '-listened_at'], name='lh_user_time_idx'),
+        ),
+        # Expression index for the analytics CTE's GROUP BY DATE(listened_at)
+        # filtered by user_id
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS lh_user_date "
+                "ON songs_listeninghistory (user_id, (DATE(listened_at)));",
+            reverse_sql="DROP INDEX IF EXISTS lh_user_date;",
+        ),
+        # Partial trigram index: the search paths only ever match titles of
+        # approved songs, so skip unapproved rows entirely
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS song_approved_title_trgm "
+                "ON songs_song USING gin (title gin_trgm_ops) "
+                "WHERE approved = true;",
+            reverse_sql="DROP INDEX IF EXISTS song_approved_title_trgm;",
+        ),
+    ]
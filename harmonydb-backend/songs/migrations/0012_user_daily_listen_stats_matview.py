@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0011_listeninghistory_lh_user_time_idx'),
+    ]
+
+    operations = [
+        # Per-user daily listening rollup backing the history analytics.
+        # The daily-trends CTE previously re-aggregated the user's entire
+        # history on every page load; reading this view is an index range
+        # scan of ~30 rows. Refreshed concurrently after each history
+        # batch flush (songs.tasks.flush_listening_history).
+        migrations.RunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW user_daily_listen_stats AS
+                SELECT lh.user_id,
+                       DATE(lh.listened_at) AS d,
+                       COUNT(*) AS daily_listens,
+                       COUNT(DISTINCT lh.song_id) AS unique_songs,
+                       COUNT(DISTINCT s.artist_id) AS unique_artists,
+                       COUNT(DISTINCT s.genre_id) AS unique_genres,
+                       AVG(s.duration) AS avg_song_duration
+                FROM songs_listeninghistory lh
+                INNER JOIN songs_song s ON lh.song_id = s.id
+                GROUP BY lh.user_id, DATE(lh.listened_at);
+
+                CREATE UNIQUE INDEX user_daily_listen_stats_uniq
+                ON user_daily_listen_stats (user_id, d);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS user_daily_listen_stats;",
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0012_user_daily_listen_stats_matview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='song',
+            name='file_size',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Materialized roll-up behind the popular-songs demo/dashboard reads.
+    The old popular_songs_view re-ran its joins and aggregates on every
+    request; the matview is refreshed on a 5-minute beat schedule and
+    queried like a small indexed table. The unique index on id is
+    required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    """
+
+    dependencies = [
+        ('songs', '0013_song_file_size'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                DROP VIEW IF EXISTS popular_songs_view;
+                CREATE MATERIALIZED VIEW IF NOT EXISTS popular_songs_mv AS
+                SELECT
+                    s.id,
+                    s.title,
+                    u.username AS artist_name,
+                    u.stage_name,
+                    g.name AS genre_name,
+                    s.play_count,
+                    s.duration,
+                    COUNT(DISTINCT lh.id) AS listen_count,
+                    COUNT(DISTINCT f.id) AS favorite_count
+                FROM songs_song s
+                INNER JOIN users_user u ON s.artist_id = u.id
+                LEFT JOIN songs_genre g ON s.genre_id = g.id
+                LEFT JOIN songs_listeninghistory lh ON s.id = lh.song_id
+                LEFT JOIN songs_favorite f ON s.id = f.item_id AND f.item_type = 'song'
+                WHERE s.approved = true
+                GROUP BY s.id, s.title, u.username, u.stage_name, g.name,
+                         s.play_count, s.duration
+                HAVING s.play_count > 0
+                WITH DATA;
+                CREATE UNIQUE INDEX IF NOT EXISTS popular_songs_mv_id
+                    ON popular_songs_mv (id);
+            """,
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS popular_songs_mv;",
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0014_popular_songs_mv'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='album',
+            index=models.Index(fields=['-created_at'], name='album_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(condition=models.Q(('approved', True)), fields=['-upload_date'], name='song_approved_upload_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(fields=['artist', '-upload_date'], name='song_artist_upload_idx'),
+        ),
+        # Refresh planner statistics so the new indexes are considered
+        # immediately instead of after the next autovacuum pass
+        migrations.RunSQL(
+            sql="ANALYZE songs_song; ANALYZE songs_album;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:56
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('songs', '0015_album_album_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='song',
+            name='search_doc',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='song',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_doc'], name='song_search_doc_gin'),
+        ),
+        # Triggers keep search_doc current: per-song on title/artist
+        # change, and fan-out from users_user when an artist renames
+        # (rare). A generated column can't be used here because it may
+        # not reference another table.
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION song_search_doc_update() RETURNS trigger AS $$
+                BEGIN
+                    SELECT to_tsvector('english',
+                               NEW.title || ' ' || COALESCE(u.stage_name, '') || ' ' || u.username)
+                    INTO NEW.search_doc
+                    FROM users_user u
+                    WHERE u.id = NEW.artist_id;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER song_search_doc_trg
+                BEFORE INSERT OR UPDATE OF title, artist_id ON songs_song
+                FOR EACH ROW EXECUTE FUNCTION song_search_doc_update();
+
+                CREATE OR REPLACE FUNCTION user_search_doc_update() RETURNS trigger AS $$
+                BEGIN
+                    UPDATE songs_song s
+                    SET search_doc = to_tsvector('english',
+                            s.title || ' ' || COALESCE(NEW.stage_name, '') || ' ' || NEW.username)
+                    WHERE s.artist_id = NEW.id;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER user_search_doc_trg
+                AFTER UPDATE OF username, stage_name ON users_user
+                FOR EACH ROW
+                WHEN (OLD.username IS DISTINCT FROM NEW.username
+                      OR OLD.stage_name IS DISTINCT FROM NEW.stage_name)
+                EXECUTE FUNCTION user_search_doc_update();
+
+                -- Backfill existing rows
+                UPDATE songs_song s
+                SET search_doc = to_tsvector('english',
+                        s.title || ' ' || COALESCE(u.stage_name, '') || ' ' || u.username)
+                FROM users_user u
+                WHERE u.id = s.artist_id;
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS user_search_doc_trg ON users_user;
+                DROP FUNCTION IF EXISTS user_search_doc_update();
+                DROP TRIGGER IF EXISTS song_search_doc_trg ON songs_song;
+                DROP FUNCTION IF EXISTS song_search_doc_update();
+            """,
+        ),
+    ]
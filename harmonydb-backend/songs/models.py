@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 
 User = get_user_model()
 
@@ -17,6 +19,19 @@ class Album(models.Model):
     release_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Generated tsvector column kept in sync by Postgres; searched via GIN index
+    search_vector = models.GeneratedField(
+        expression=SearchVector('title', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='album_search_vector_gin'),
+            # Newest-first album listing
+            models.Index(fields=['-created_at'], name='album_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.artist.username}"
@@ -28,26 +43,92 @@ class Song(models.Model):
     genre = models.ForeignKey(Genre, on_delete=models.SET_NULL, null=True, blank=True)
     cover_image = models.ImageField(upload_to="song_covers/", null=True, blank=True)
     audio_file = models.FileField(upload_to="songs/")
+    # Captured at upload so the streaming path never stats the file
+    file_size = models.BigIntegerField(null=True, blank=True)
     release_date = models.DateField(auto_now_add=True)
     duration = models.FloatField(default=0)  # seconds
     play_count = models.PositiveIntegerField(default=0)
     upload_date = models.DateTimeField(auto_now_add=True)
     approved = models.BooleanField(default=True)
+    # Generated tsvector column kept in sync by Postgres; searched via GIN index
+    search_vector = models.GeneratedField(
+        expression=SearchVector('title', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    # Title plus denormalized artist names, maintained by the
+    # song_search_doc_trg / user_search_doc_trg triggers (a generated
+    # column can't reference users_user), so the list search matches
+    # artists without joining to users
+    search_doc = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='song_search_vector_gin'),
+            GinIndex(fields=['search_doc'], name='song_search_doc_gin'),
+            # Genre-partitioned popularity (genre_rank window, per-genre charts)
+            models.Index(fields=['genre', '-play_count'], name='song_genre_plays_idx'),
+            # Newest-first listing over the approved catalog (partial: the
+            # default list view always filters approved=True)
+            models.Index(
+                fields=['-upload_date'],
+                condition=models.Q(approved=True),
+                name='song_approved_upload_idx',
+            ),
+            # Per-artist discography ordered newest-first
+            models.Index(fields=['artist', '-upload_date'], name='song_artist_upload_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.file_size is None and self.audio_file:
+            self.file_size = self.audio_file.size
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.title} - {self.artist.username}"
 
 class Playlist(models.Model):
+    # Size categories, largest threshold first (see type_for_song_count)
+    TYPE_THRESHOLDS = [
+        (100, 'mega'),
+        (50, 'large'),
+        (20, 'medium'),
+        (5, 'small'),
+    ]
+
     name = models.CharField(max_length=255)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="playlists")
     cover_image = models.ImageField(upload_to="playlist_covers/", null=True, blank=True)
     is_public = models.BooleanField(default=True)
+    # Denormalized rollups, kept current by PlaylistSong signals so the list
+    # views read flat columns instead of aggregating the junction table.
+    # total_plays drifts as songs get played; a periodic Celery task resyncs.
+    playlist_type = models.CharField(max_length=8, default='mini', db_index=True)
+    song_count = models.PositiveIntegerField(default=0)
+    total_duration = models.FloatField(default=0)  # seconds
+    total_plays = models.PositiveBigIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Generated tsvector column kept in sync by Postgres; searched via GIN index
+    search_vector = models.GeneratedField(
+        expression=SearchVector('name', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [GinIndex(fields=['search_vector'], name='playlist_search_vector_gin')]
 
     def __str__(self):
         return f"{self.name} - {self.user.username}"
 
+    @classmethod
+    def type_for_song_count(cls, song_count):
+        for threshold, label in cls.TYPE_THRESHOLDS:
+            if song_count >= threshold:
+                return label
+        return 'mini'
+
 class PlaylistSong(models.Model):
     playlist = models.ForeignKey(Playlist, on_delete=models.CASCADE, related_name="playlist_songs")
     song = models.ForeignKey(Song, on_delete=models.CASCADE, related_name="in_playlists")
@@ -57,6 +138,10 @@ class PlaylistSong(models.Model):
     class Meta:
         unique_together = ('playlist', 'song')
         ordering = ['order', 'added_at']
+        indexes = [
+            # Recent-activity EXISTS filter in the playlist list view
+            models.Index(fields=['playlist', 'added_at'], name='ps_playlist_added_idx'),
+        ]
 
 class Favorite(models.Model):
     ITEM_CHOICES = [
@@ -72,12 +157,28 @@ class Favorite(models.Model):
 
     class Meta:
         unique_together = ('user', 'item_type', 'item_id')
+        indexes = [
+            # Lets the correlated favorite_count subqueries in the list views
+            # resolve with an index-only scan instead of a per-row seq scan
+            models.Index(fields=['item_type', 'item_id'], name='fav_type_item_idx'),
+            # Per-user favorite stats grouped by type
+            models.Index(fields=['user', 'item_type'], name='fav_user_type_idx'),
+        ]
 
 class ListeningHistory(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="listening_history")
     song = models.ForeignKey(Song, on_delete=models.CASCADE, related_name="listening_history")
     listened_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Time-windowed listen aggregations (trending, recent genres)
+            models.Index(fields=['listened_at', 'song'], name='lh_listened_song_idx'),
+            # Per-user history list: serves the ORDER BY -listened_at
+            # top-N directly instead of sorting the whole user history
+            models.Index(fields=['user', '-listened_at'], name='lh_user_time_idx'),
+        ]
+
 class Comment(models.Model):
     ITEM_CHOICES = [
         ('song', 'Song'),
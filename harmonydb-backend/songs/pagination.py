@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class PopularPlaylistCursorPagination(CursorPagination):
+    """
+    Keyset pagination for popularity-ordered playlist lists. OFFSET/LIMIT
+    forces Postgres to sort the whole annotated result and discard the first
+    N rows per page; a cursor over the ordering tuple makes every page an
+    O(page_size) range scan.
+    """
+    page_size = 20
+    ordering = ('-favorite_count', '-total_plays', '-id')
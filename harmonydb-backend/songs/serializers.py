@@ -51,7 +51,8 @@ class AlbumSerializer(serializers.ModelSerializer):
         read_only_fields = ['artist']
 
     def get_songs_count(self, obj):
-        return obj.songs.count()
+        # len() reuses the prefetched songs instead of a COUNT query
+        return len(obj.songs.all())
 
     def create(self, validated_data):
         validated_data['artist'] = self.context['request'].user
@@ -79,7 +80,9 @@ class PlaylistSerializer(serializers.ModelSerializer):
         read_only_fields = ['user']
 
     def get_songs_count(self, obj):
-        return obj.playlist_songs.count()
+        # len() reads the prefetch cache the list views populate; .count()
+        # would issue a COUNT query per playlist
+        return len(obj.playlist_songs.all())
 
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
@@ -95,20 +98,33 @@ class FavoriteSerializer(serializers.ModelSerializer):
 
     def get_item(self, obj):
         """Get the actual item data based on item_type and item_id"""
+        # Views that list many favorites batch-resolve the items up front
+        # and attach them as _prefetched_item to avoid a query per row
+        if hasattr(obj, '_prefetched_item'):
+            item = obj._prefetched_item
+            if item is None:
+                return None
+            return self._serialize_item(obj.item_type, item)
         try:
             if obj.item_type == 'song':
-                song = Song.objects.get(id=obj.item_id)
-                return SongSerializer(song, context=self.context).data
+                return self._serialize_item('song', Song.objects.get(id=obj.item_id))
             elif obj.item_type == 'album':
-                album = Album.objects.get(id=obj.item_id)
-                return AlbumSerializer(album, context=self.context).data
+                return self._serialize_item('album', Album.objects.get(id=obj.item_id))
             elif obj.item_type == 'playlist':
-                playlist = Playlist.objects.get(id=obj.item_id)
-                return PlaylistSerializer(playlist, context=self.context).data
+                return self._serialize_item('playlist', Playlist.objects.get(id=obj.item_id))
         except (Song.DoesNotExist, Album.DoesNotExist, Playlist.DoesNotExist):
             return None
         return None
 
+    def _serialize_item(self, item_type, item):
+        if item_type == 'song':
+            return SongSerializer(item, context=self.context).data
+        elif item_type == 'album':
+            return AlbumSerializer(item, context=self.context).data
+        elif item_type == 'playlist':
+            return PlaylistSerializer(item, context=self.context).data
+        return None
+
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
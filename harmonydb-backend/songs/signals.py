@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Album, Playlist, PlaylistSong, Song
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=PlaylistSong)
+def update_playlist_rollups(sender, instance, **kwargs):
+    """
+    Keep the denormalized Playlist columns (playlist_type, song_count,
+    total_duration, total_plays) current as songs enter/leave the playlist.
+    """
+    totals = PlaylistSong.objects.filter(playlist_id=instance.playlist_id).aggregate(
+        song_count=Count('id'),
+        total_duration=Coalesce(Sum('song__duration'), 0.0),
+        total_plays=Coalesce(Sum('song__play_count'), 0),
+    )
+    Playlist.objects.filter(pk=instance.playlist_id).update(
+        playlist_type=Playlist.type_for_song_count(totals['song_count']),
+        **totals,
+    )
+
+
+@receiver(post_save, sender=Song)
+def increment_artist_song_counters(sender, instance, created, **kwargs):
+    """Bump the artist's denormalized song counters on upload (atomic
+    F() update, so concurrent uploads don't race)."""
+    if created:
+        User.objects.filter(pk=instance.artist_id).update(
+            cached_song_count=F('cached_song_count') + 1,
+            cached_total_plays=F('cached_total_plays') + instance.play_count,
+        )
+
+
+@receiver(post_delete, sender=Song)
+def decrement_artist_song_counters(sender, instance, **kwargs):
+    User.objects.filter(pk=instance.artist_id).update(
+        cached_song_count=F('cached_song_count') - 1,
+        cached_total_plays=F('cached_total_plays') - instance.play_count,
+    )
+
+
+@receiver(post_save, sender=Album)
+def increment_artist_album_counter(sender, instance, created, **kwargs):
+    if created:
+        User.objects.filter(pk=instance.artist_id).update(
+            cached_album_count=F('cached_album_count') + 1,
+        )
+
+
+@receiver(post_delete, sender=Album)
+def decrement_artist_album_counter(sender, instance, **kwargs):
+    User.objects.filter(pk=instance.artist_id).update(
+        cached_album_count=F('cached_album_count') - 1,
+    )
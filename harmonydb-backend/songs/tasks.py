@@ -0,0 +1,170 @@
+import json
+import os
+from collections import Counter
+
+import redis
+from celery import shared_task
+from django.db import connection
+from django.db.models import F
+
+from .models import ListeningHistory, Song
+
+# Redis list buffering play events until the flush task drains it
+HISTORY_BUFFER_KEY = 'history_buffer'
+
+
+def history_redis():
+    """Raw Redis client for the play-event buffer (the cache API has no
+    list operations)."""
+    return redis.Redis.from_url(os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'))
+
+
+@shared_task
+def refresh_popular_and_recent_playlists():
+    """
+    Refresh the popular_and_recent_playlists materialized view so the
+    playlist list endpoint reads a precomputed snapshot instead of
+    re-running the UNION aggregation on every request.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY popular_and_recent_playlists"
+        )
+
+
+@shared_task
+def resync_playlist_rollups():
+    """
+    Recompute the denormalized Playlist rollup columns from scratch. The
+    PlaylistSong signals keep them current on membership changes, but
+    total_plays drifts as songs accumulate plays, so this runs periodically.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            UPDATE songs_playlist p
+            SET song_count = c.ct,
+                total_duration = COALESCE(c.dur, 0),
+                total_plays = COALESCE(c.plays, 0)
+            FROM (
+                SELECT ps.playlist_id,
+                       COUNT(*) AS ct,
+                       SUM(s.duration) AS dur,
+                       SUM(s.play_count) AS plays
+                FROM songs_playlistsong ps
+                INNER JOIN songs_song s ON s.id = ps.song_id
+                GROUP BY ps.playlist_id
+            ) c
+            WHERE c.playlist_id = p.id;
+        """)
+        cursor.execute("""
+            UPDATE songs_playlist
+            SET song_count = 0, total_duration = 0, total_plays = 0
+            WHERE id NOT IN (SELECT playlist_id FROM songs_playlistsong);
+        """)
+
+
+@shared_task
+def resync_artist_counters():
+    """
+    Recompute the denormalized User artist counters from scratch. The
+    Song/Album signals keep the counts current on insert/delete, but
+    cached_total_plays drifts as play counts accumulate.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            UPDATE users_user u
+            SET cached_song_count = c.ct,
+                cached_total_plays = COALESCE(c.plays, 0)
+            FROM (
+                SELECT artist_id, COUNT(*) AS ct, SUM(play_count) AS plays
+                FROM songs_song
+                GROUP BY artist_id
+            ) c
+            WHERE c.artist_id = u.id;
+        """)
+        cursor.execute("""
+            UPDATE users_user
+            SET cached_song_count = 0, cached_total_plays = 0
+            WHERE role = 'artist'
+              AND id NOT IN (SELECT artist_id FROM songs_song);
+        """)
+        cursor.execute("""
+            UPDATE users_user u
+            SET cached_album_count = c.ct
+            FROM (
+                SELECT artist_id, COUNT(*) AS ct
+                FROM songs_album
+                GROUP BY artist_id
+            ) c
+            WHERE c.artist_id = u.id;
+        """)
+        cursor.execute("""
+            UPDATE users_user
+            SET cached_album_count = 0
+            WHERE role = 'artist'
+              AND id NOT IN (SELECT artist_id FROM songs_album);
+        """)
+
+
+@shared_task
+def flush_listening_history():
+    """
+    Drain the Redis play-event buffer into ListeningHistory with one
+    bulk INSERT per batch. AddToHistoryView and SongStreamView push
+    events and return immediately, so write throughput is one commit per
+    ~500 events instead of one per play. Stream events carry a 'p' flag
+    and their play_count increments are coalesced into one UPDATE per
+    song rather than one per play.
+    """
+    client = history_redis()
+    flushed = False
+    play_increments = Counter()
+    while True:
+        pipe = client.pipeline()
+        pipe.lrange(HISTORY_BUFFER_KEY, 0, 499)
+        pipe.ltrim(HISTORY_BUFFER_KEY, 500, -1)
+        raw_events, _ = pipe.execute()
+        if not raw_events:
+            break
+        events = [json.loads(raw) for raw in raw_events]
+        ListeningHistory.objects.bulk_create(
+            [ListeningHistory(user_id=e['u'], song_id=e['s']) for e in events],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        play_increments.update(e['s'] for e in events if e.get('p'))
+        flushed = True
+    for song_id, n in play_increments.items():
+        Song.objects.filter(id=song_id).update(play_count=F('play_count') + n)
+    if flushed:
+        # Keep the per-user daily rollup in step with the new rows
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY user_daily_listen_stats"
+            )
+
+
+@shared_task
+def refresh_popular_songs():
+    """
+    Refresh the popular_songs_mv roll-up so the SQL demo/dashboard
+    endpoints read a precomputed snapshot instead of re-aggregating
+    listens and favorites per request.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY popular_songs_mv"
+        )
+
+
+@shared_task
+def refresh_monthly_genre_trends():
+    """
+    Refresh the monthly genre trends materialized view consumed by
+    GenreAnalyticsView (the aggregates change at most daily, so an hourly
+    refresh is plenty).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_monthly_genre_trends"
+        )
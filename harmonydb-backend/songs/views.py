@@ -1,18 +1,22 @@
 from django.shortcuts import get_object_or_404
-from django.http import FileResponse, HttpResponse
-from django.db import connection, transaction
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.db import IntegrityError, connection, connections, transaction
 from rest_framework import generics, permissions, parsers, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from django.db.models import (
-    Q, F, Count, Sum, Avg, Min, Max, Case, When, Value, 
-    OuterRef, Subquery, Exists, Window,
+    Q, F, Count, Sum, Avg, Min, Max, Case, When, Value,
+    OuterRef, Subquery, Exists, Window, Prefetch,
     CharField, IntegerField, FloatField
 )
+from django.db.models.expressions import RawSQL
 from django.db.models.functions import (
-    TruncDate, TruncMonth, TruncYear, Coalesce, Cast, Concat, 
-    Extract, Now, Lower, Upper, Length, Substr, Rank, DenseRank, RowNumber
+    TruncDate, TruncMonth, TruncYear, Coalesce, Cast, Concat,
+    Extract, Now, Lower, Upper, Length, Substr, Rank, DenseRank, RowNumber,
+    JSONObject
 )
 from .models import Song, Album, Genre, Playlist, PlaylistSong, Favorite, ListeningHistory, Comment, AIPrompt, AIInteraction
 from .serializers import (
@@ -20,16 +24,253 @@ from .serializers import (
     PlaylistSongSerializer, FavoriteSerializer, ListeningHistorySerializer, 
     CommentSerializer, AIPromptSerializer, AIInteractionSerializer
 )
-from users.permissions import IsArtistOrReadOnly, IsOwnerOrReadOnly, IsArtist
+from .pagination import PopularPlaylistCursorPagination
+from .tasks import HISTORY_BUFFER_KEY, history_redis
+from users.permissions import (
+    IsArtistOrReadOnly, IsOwnerOrReadOnly, IsArtist, PermissionAwareQuerysetMixin
+)
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extras import RealDictCursor
 from datetime import datetime, timedelta
+import hashlib
+import itertools
+import json
 import os
+import re
+import weakref
+
+# Statement names already PREPAREd, tracked per underlying DB connection
+# (weak keys so entries die with the connection)
+_PREPARED_STATEMENTS = weakref.WeakKeyDictionary()
+
+
+def execute_prepared(cursor, name, sql, params):
+    """
+    Execute a hot, static SQL string through a server-side prepared
+    statement. The first call on a connection PREPAREs the plan; later
+    calls just EXECUTE it, skipping the parse+plan cost of re-sending
+    the full statement on every request.
+    """
+    raw_conn = connection.connection
+    prepared = _PREPARED_STATEMENTS.setdefault(raw_conn, set())
+    if name not in prepared:
+        counter = itertools.count(1)
+        dollar_sql = re.sub(r'%s', lambda _m: f'${next(counter)}', sql)
+        cursor.execute(f'PREPARE {name} AS {dollar_sql}')
+        prepared.add(name)
+    placeholders = ', '.join(['%s'] * len(params))
+    cursor.execute(f'EXECUTE {name} ({placeholders})', params)
+
+
+def dict_cursor():
+    """
+    Raw psycopg2 cursor with RealDictCursor, so rows come back as dicts
+    built in C instead of per-row dict(zip(columns, row)) in Python.
+    """
+    connection.ensure_connection()
+    return connection.connection.cursor(cursor_factory=RealDictCursor)
+
+
+def stream_dict_rows(sql, params=None):
+    """
+    Yield raw-SQL result rows as dicts from a server-side cursor.
+    Unbounded result sets stream in chunks instead of materializing
+    twice (tuple list from fetchall, then dict list); the tight LIMITed
+    queries stay on plain cursors where fetchall is fine.
+    """
+    cursor = connection.chunked_cursor()
+    try:
+        cursor.execute(sql, params)
+        # Named cursors only expose description once rows start flowing
+        columns = None
+        for row in cursor:
+            if columns is None:
+                columns = [col[0] for col in cursor.description]
+            yield dict(zip(columns, row))
+    finally:
+        cursor.close()
+
+
+def _file_chunks(path, start, length, chunk_size=64 * 1024):
+    """
+    Yield a byte range of a file in 64KB chunks so range responses
+    stream to the socket instead of materializing the whole slice as one
+    Python bytes object.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+# Artist search: one combined-column trigram probe (the concatenation
+# must mirror the users_user_search_trgm index expression), with the
+# CASE scoring and rollup-column reads only over matched rows
+ARTIST_SEARCH_SQL = """
+    WITH matched AS (
+        SELECT id, username, stage_name,
+               cached_song_count, cached_album_count, cached_total_plays,
+               CASE WHEN lower(username) = lower(%s)
+                      OR lower(stage_name) = lower(%s)
+                    THEN 100 ELSE 80 END AS relevance_score
+        FROM users_user
+        WHERE role = 'artist'
+          AND (COALESCE(username, '') || ' ' || COALESCE(stage_name, ''))
+              ILIKE %s
+    )
+    SELECT m.id, m.username, m.stage_name,
+           m.cached_song_count AS song_count,
+           m.cached_album_count AS album_count,
+           m.cached_total_plays AS total_plays,
+           av.avg_song_duration,
+           m.relevance_score
+    FROM matched m
+    LEFT JOIN (
+        SELECT artist_id, AVG(duration) AS avg_song_duration
+        FROM songs_song
+        WHERE artist_id IN (SELECT id FROM matched)
+        GROUP BY artist_id
+    ) av ON av.artist_id = m.id
+    ORDER BY m.relevance_score DESC, total_plays DESC
+    LIMIT 15
+"""
+
+# Listening-history analytics: four jsonb result sets over one shared
+# filtered CTE; {filters} is one of four static per-user filter shapes and
+# {daily_source} reads the user_daily_listen_stats matview when no hour
+# filter applies (an index range scan) or re-aggregates from the filtered
+# rows when one does
+LISTENING_ANALYTICS_SQL = """
+    WITH filtered AS (
+        SELECT lh.song_id, lh.listened_at,
+               s.artist_id, s.genre_id, s.duration
+        FROM songs_listeninghistory lh
+        INNER JOIN songs_song s ON lh.song_id = s.id
+        WHERE {filters}
+    ),
+    daily_stats AS (
+        {daily_source}
+    ),
+    daily_trends AS (
+        SELECT
+            listen_date,
+            daily_listens,
+            unique_songs,
+            unique_artists,
+            LAG(daily_listens) OVER (ORDER BY listen_date) as prev_day_listens,
+            daily_listens - LAG(daily_listens) OVER (ORDER BY listen_date) as daily_change
+        FROM daily_stats
+        ORDER BY listen_date DESC
+        LIMIT 30
+    ),
+    genre_stats AS (
+        SELECT
+            g.name as song__genre__name,
+            COUNT(*) as listen_count,
+            COUNT(DISTINCT f.song_id) as unique_songs,
+            SUM(f.duration) as total_duration,
+            AVG(f.duration) as avg_song_duration
+        FROM filtered f
+        LEFT JOIN songs_genre g ON f.genre_id = g.id
+        GROUP BY g.name
+        HAVING COUNT(*) >= 2
+        ORDER BY COUNT(*) DESC
+    ),
+    hourly_counts AS (
+        SELECT
+            EXTRACT(hour FROM listened_at)::int as listen_hour,
+            COUNT(*) as count
+        FROM filtered
+        GROUP BY EXTRACT(hour FROM listened_at)::int
+        ORDER BY listen_hour
+    ),
+    top_songs_cte AS (
+        SELECT
+            s.title as song__title,
+            u.username as song__artist__username,
+            COUNT(*) as play_count,
+            MIN(f.listened_at) as first_listen,
+            MAX(f.listened_at) as last_listen
+        FROM filtered f
+        INNER JOIN songs_song s ON f.song_id = s.id
+        INNER JOIN users_user u ON s.artist_id = u.id
+        GROUP BY s.id, s.title, u.username
+        ORDER BY COUNT(*) DESC
+        LIMIT 10
+    )
+    SELECT
+        (SELECT COALESCE(jsonb_agg(d), '[]'::jsonb) FROM daily_trends d),
+        (SELECT COALESCE(jsonb_agg(g), '[]'::jsonb) FROM genre_stats g),
+        (SELECT COALESCE(jsonb_agg(h), '[]'::jsonb) FROM hourly_counts h),
+        (SELECT COALESCE(jsonb_agg(t), '[]'::jsonb) FROM top_songs_cte t)
+"""
 
 # ==================== SONG VIEWS ====================
-class SongListCreateView(generics.ListCreateAPIView):
+class KeysetPagination(CursorPagination):
+    """
+    Seek-style pagination: each page is a bounded index range scan on
+    the ordering columns (WHERE (ts, id) < (cursor) ORDER BY ... LIMIT n),
+    so deep pages cost the same as page one instead of scanning and
+    discarding every earlier row the way OFFSET does.
+    """
+    page_size = 50
+    ordering = ('-created_at', '-id')
+
+
+class ListeningHistoryPagination(KeysetPagination):
+    ordering = ('-listened_at', '-id')
+
+
+class CatalogETagMixin:
+    """
+    Conditional GET + Redis caching for public catalog list endpoints.
+    The ETag keys on the catalog's newest change marker plus the query
+    string, so polling clients mostly get a 304 back at the cost of one
+    small aggregate, and 200 responses for a known ETag are served from
+    the cached JSON blob without touching the ORM or DRF rendering.
+    """
+    etag_timeout = 60
+
+    def get_etag_source(self):
+        """Cheap value that changes whenever the listed data changes."""
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        etag = '"{}"'.format(
+            hashlib.blake2b(
+                f'{self.get_etag_source()}:{request.GET.urlencode()}'.encode(),
+                digest_size=16,
+            ).hexdigest()
+        )
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        cache_key = f'catalog_etag:{etag}'
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, self.etag_timeout)
+        response = Response(data)
+        response['ETag'] = etag
+        return response
+
+
+class SongListCreateView(CatalogETagMixin, generics.ListCreateAPIView):
     serializer_class = SongSerializer
     permission_classes = [IsArtistOrReadOnly]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
+    def get_etag_source(self):
+        return Song.objects.filter(approved=True).aggregate(
+            m=Max('upload_date')
+        )['m']
+
     def get_queryset(self):
         """
         Enhanced song listing with comprehensive SQL demonstrations:
@@ -39,9 +280,16 @@ class SongListCreateView(generics.ListCreateAPIView):
         - Window functions for ranking
         - Aggregations and annotations
         """
-        # Base queryset with JOINs (INNER JOIN artist, LEFT JOIN album/genre)
+        # Base queryset with JOINs (INNER JOIN artist, LEFT JOIN album/genre),
+        # narrowed to the columns SongSerializer reads so the wide joined
+        # rows (tsvector columns, user profile text) stay out of the SELECT
         queryset = Song.objects.select_related(
             'artist', 'album', 'genre'
+        ).only(
+            'title', 'artist', 'album', 'genre', 'cover_image', 'audio_file',
+            'release_date', 'duration', 'play_count', 'upload_date', 'approved',
+            'artist__username', 'artist__stage_name', 'artist__role',
+            'artist__display_name', 'album__title', 'genre__name',
         ).filter(approved=True).annotate(
             # Window function: Rank songs by play count within genre
             genre_rank=Window(
@@ -84,14 +332,20 @@ class SongListCreateView(generics.ListCreateAPIView):
         
         # Advanced filtering with various SQL concepts
         
-        # LIKE pattern matching with OR conditions
+        # Index-backed search: search_doc is a trigger-maintained tsvector
+        # over the title plus denormalized artist names, so one GIN probe
+        # covers what used to be an OR across two users_user predicates.
+        # Trigram fallbacks keep substring matches on song/album titles;
+        # genre names are a tiny table either way
         search = self.request.query_params.get('search')
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |  # LIKE '%search%'
-                Q(artist__username__icontains=search) |
-                Q(artist__stage_name__icontains=search) |
-                Q(album__title__icontains=search) |
+            search_query = SearchQuery(search, config='english')
+            queryset = queryset.annotate(
+                search_rank=SearchRank(F('search_doc'), search_query)
+            ).filter(
+                Q(search_doc=search_query) |
+                Q(title__trigram_similar=search) |
+                Q(album__title__trigram_similar=search) |
                 Q(genre__name__icontains=search)
             )
         
@@ -123,10 +377,11 @@ class SongListCreateView(generics.ListCreateAPIView):
                 Exists(ListeningHistory.objects.filter(song=OuterRef('pk')))
             )
         
-        # Date filtering: Recent uploads
+        # Date filtering: Recent uploads (DB-side NOW() keeps the SQL text
+        # stable for plan caching and avoids app/DB clock skew)
         days_ago = self.request.query_params.get('days_ago')
         if days_ago:
-            cutoff_date = datetime.now() - timedelta(days=int(days_ago))
+            cutoff_date = Now() - timedelta(days=int(days_ago))
             queryset = queryset.filter(upload_date__gte=cutoff_date)
         
         # Popularity filtering
@@ -142,7 +397,13 @@ class SongListCreateView(generics.ListCreateAPIView):
                 queryset = queryset.filter(play_count__lt=10)
         
         # Ordering options demonstrating ORDER BY variations
-        order_by = self.request.query_params.get('order_by', 'recent')
+        order_by = self.request.query_params.get('order_by')
+        if order_by is None and search:
+            # Searches default to relevance (ts_rank), best matches first
+            queryset = queryset.order_by('-search_rank', '-play_count')
+            return queryset
+        if order_by is None:
+            order_by = 'recent'
         if order_by == 'popular':
             queryset = queryset.order_by('-play_count', '-upload_date')
         elif order_by == 'alphabetical':
@@ -214,49 +475,100 @@ class SongListCreateView(generics.ListCreateAPIView):
             upload_date=datetime.now()
         )
 
-class SongDetailView(generics.RetrieveUpdateDestroyAPIView):
+class SongDetailView(PermissionAwareQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Song.objects.all()
     serializer_class = SongSerializer
     permission_classes = [IsOwnerOrReadOnly]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             # For modifications, only allow artists to modify their own songs
-            return Song.objects.filter(artist=self.request.user)
-        return Song.objects.filter(approved=True)
+            return queryset.filter(artist=self.request.user)
+        return queryset.filter(approved=True)
+
+    def get_object(self):
+        # The mutating queryset is already owner-scoped, so the single
+        # indexed SELECT is the authoritative guard; skip DRF's
+        # object-permission pass, which would just re-check ownership
+        # in Python on the row we fetched
+        if self.request.method in ['PUT', 'PATCH', 'DELETE']:
+            return get_object_or_404(self.get_queryset(), pk=self.kwargs['pk'])
+        return super().get_object()
 
 class SongStreamView(APIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request, pk):
         song = get_object_or_404(Song, pk=pk)
-        
-        # Record listening history if user is authenticated
+
+        # Audio files are immutable after upload, so a stable ETag lets
+        # revalidating clients skip the transfer entirely; replays are
+        # not counted as plays (the dedup window absorbs most anyway)
+        etag = f'"{song.id}-{song.file_size or 0}"'
+        if request.headers.get("If-None-Match") == etag:
+            return HttpResponse(status=304)
+
+        # Record the play off the request path: buffer the event for the
+        # flush task, which bulk-inserts history and coalesces play_count
+        # increments per song. Anonymous plays have no history row, so
+        # their increment is applied directly (still a single atomic
+        # UPDATE, no read-modify-write).
         if request.user.is_authenticated:
-            ListeningHistory.objects.create(user=request.user, song=song)
-        
+            # Same 30s dedup window as AddToHistoryView, so range
+            # requests for one playback count as a single play
+            if cache.add(f'lh_dedup:{request.user.id}:{song.id}', 1, 30):
+                history_redis().rpush(
+                    HISTORY_BUFFER_KEY,
+                    json.dumps({'u': request.user.id, 's': song.id, 'p': 1}),
+                )
+                try:
+                    cache.incr(f'listen_analytics_ver:{request.user.id}')
+                except ValueError:
+                    pass
+        else:
+            Song.objects.filter(pk=song.pk).update(play_count=F('play_count') + 1)
+
+        if settings.AUDIO_X_ACCEL_REDIRECT:
+            # Hand the transfer to nginx: the internal /protected/
+            # location aliases MEDIA_ROOT and serves the file with
+            # sendfile(2), handling Range requests itself, so no audio
+            # bytes pass through the Python heap
+            resp = HttpResponse(content_type="audio/mpeg")
+            resp["X-Accel-Redirect"] = f"/protected/{song.audio_file.name}"
+            resp["Accept-Ranges"] = "bytes"
+            resp["Cache-Control"] = "public, max-age=86400"
+            resp["ETag"] = etag
+            return resp
+
         file_path = song.audio_file.path
-        file_size = os.path.getsize(file_path)
+        # Denormalized at upload; the stat() fallback covers rows
+        # predating the file_size column
+        file_size = song.file_size or os.path.getsize(file_path)
         range_header = request.headers.get("Range", "").strip()
         range_match = None
         if range_header.startswith("bytes="):
             range_match = range_header.replace("bytes=", "").split("-")
 
-        with open(file_path, "rb") as f:
-            if range_match:
-                start = int(range_match[0])
-                end = int(range_match[1]) if range_match[1] else file_size - 1
-                f.seek(start)
-                data = f.read(end - start + 1)
-                resp = HttpResponse(data, status=206, content_type="audio/mpeg")
-                resp["Content-Range"] = f"bytes {start}-{end}/{file_size}"
-            else:
-                resp = FileResponse(f, content_type="audio/mpeg")
-                resp["Content-Length"] = file_size
-        
-        song.play_count += 1
-        song.save(update_fields=["play_count"])
+        if range_match:
+            start = int(range_match[0])
+            end = int(range_match[1]) if range_match[1] else file_size - 1
+            resp = StreamingHttpResponse(
+                _file_chunks(file_path, start, end - start + 1),
+                status=206,
+                content_type="audio/mpeg",
+            )
+            resp["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            resp["Content-Length"] = end - start + 1
+        else:
+            # FileResponse uses wsgi.file_wrapper (sendfile where the
+            # server supports it) and closes the file when done
+            resp = FileResponse(open(file_path, "rb"), content_type="audio/mpeg")
+            resp["Content-Length"] = file_size
+        resp["Accept-Ranges"] = "bytes"
+        resp["Cache-Control"] = "public, max-age=86400"
+        resp["ETag"] = etag
         return resp
 
 # ==================== ALBUM VIEWS ====================
@@ -273,8 +585,28 @@ class AlbumListCreateView(generics.ListCreateAPIView):
         - Window functions for ranking
         - UNION operations for combining results
         """
-        # Base queryset with comprehensive annotations
-        queryset = Album.objects.select_related('artist').annotate(
+        # Base queryset with comprehensive annotations. The nested songs
+        # are prefetched with their own FKs joined so AlbumSerializer's
+        # SongSerializer rows don't each query artist/album/genre
+        queryset = Album.objects.select_related('artist').only(
+            'title', 'artist', 'cover_image', 'release_date',
+            'created_at', 'updated_at',
+            'artist__username', 'artist__stage_name', 'artist__role',
+            'artist__display_name',
+        ).prefetch_related(
+            Prefetch(
+                'songs',
+                queryset=Song.objects.select_related(
+                    'artist', 'album', 'genre'
+                ).only(
+                    'title', 'artist', 'album', 'genre', 'cover_image',
+                    'audio_file', 'release_date', 'duration', 'play_count',
+                    'upload_date', 'approved',
+                    'artist__username', 'artist__stage_name', 'artist__role',
+                    'artist__display_name', 'album__title', 'genre__name',
+                )
+            )
+        ).annotate(
             # Aggregations: Album statistics from related songs
             song_count=Count('songs', distinct=True),
             total_duration=Sum('songs__duration'),
@@ -401,7 +733,7 @@ class AlbumListCreateView(generics.ListCreateAPIView):
             )
             
             # Raw SQL example: Complex album analytics with CTE
-            with connection.cursor() as cursor:
+            with dict_cursor() as cursor:
                 cursor.execute("""
                     WITH album_stats AS (
                         SELECT 
@@ -429,11 +761,7 @@ class AlbumListCreateView(generics.ListCreateAPIView):
                     WHERE popularity_rank <= 10
                     ORDER BY popularity_rank
                 """)
-                
-                columns = [col[0] for col in cursor.description]
-                top_albums = [
-                    dict(zip(columns, row)) for row in cursor.fetchall()
-                ]
+                top_albums = cursor.fetchall()
             
             response_data = self.get_paginated_response(serializer.data).data
             response_data['statistics'] = stats
@@ -449,16 +777,18 @@ class AlbumListCreateView(generics.ListCreateAPIView):
             raise permissions.PermissionDenied("Only artists can create albums.")
         serializer.save(artist=self.request.user)
 
-class AlbumDetailView(generics.RetrieveUpdateDestroyAPIView):
+class AlbumDetailView(PermissionAwareQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Album.objects.all()
     serializer_class = AlbumSerializer
     permission_classes = [IsOwnerOrReadOnly]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             # For modifications, only allow artists to modify their own albums
-            return Album.objects.filter(artist=self.request.user)
-        return Album.objects.all()
+            return queryset.filter(artist=self.request.user)
+        return queryset
 
 class AlbumAddSongView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -492,10 +822,15 @@ class AlbumRemoveSongView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ==================== GENRE VIEWS ====================
-class GenreListCreateView(generics.ListCreateAPIView):
+class GenreListCreateView(CatalogETagMixin, generics.ListCreateAPIView):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # Genres carry no timestamp, so key on cardinality + newest id
+    # (in-place description edits are rare enough to tolerate)
+    def get_etag_source(self):
+        marker = Genre.objects.aggregate(m=Max('id'), c=Count('id'))
+        return f"{marker['m']}:{marker['c']}"
 
 class GenreDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Genre.objects.all()
@@ -557,10 +892,11 @@ class GenreAnalyticsView(APIView):
             )
         ).order_by('popularity_rank')
         
-        # 3. Raw SQL with CTEs, JOINs, and Set Operations
-        with connection.cursor() as cursor:
-            # Complex CTE demonstrating UNION, INTERSECT concepts
-            cursor.execute("""
+        # 3. Raw SQL with CTEs, JOINs, and Set Operations. The unbounded
+        # result sets stream through server-side cursors; only the
+        # LIMITed self-join stays on a plain cursor.
+        # Complex CTE demonstrating UNION, INTERSECT concepts
+        union_results = list(stream_dict_rows("""
                 WITH genre_metrics AS (
                     SELECT 
                         g.id,
@@ -591,13 +927,10 @@ class GenreAnalyticsView(APIView):
                 FROM diverse_genres
                 
                 ORDER BY category, total_plays DESC
-            """)
-            
-            columns = [col[0] for col in cursor.description]
-            union_results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # INTERSECT simulation: Genres that are both popular AND diverse
-            cursor.execute("""
+        """))
+
+        # INTERSECT simulation: Genres that are both popular AND diverse
+        intersect_results = list(stream_dict_rows("""
                 WITH popular_genres AS (
                     SELECT g.id, g.name
                     FROM songs_genre g
@@ -615,16 +948,11 @@ class GenreAnalyticsView(APIView):
                 SELECT pg.name, 'popular_and_diverse' as category
                 FROM popular_genres pg
                 INNER JOIN diverse_genres dg ON pg.id = dg.id
-            """)
-            
-            intersect_results = [
-                dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()
-            ]
-            
-            # FULL OUTER JOIN example: All genres with optional statistics
-            cursor.execute("""
-                SELECT 
+        """))
+
+        # FULL OUTER JOIN example: All genres with optional statistics
+        full_outer_results = list(stream_dict_rows("""
+                SELECT
                     g.name as genre_name,
                     COUNT(s.id) as song_count,
                     COUNT(f.id) as favorite_count,
@@ -638,14 +966,11 @@ class GenreAnalyticsView(APIView):
                 FULL OUTER JOIN songs_favorite f ON s.id = f.item_id AND f.item_type = 'song'
                 GROUP BY g.id, g.name
                 ORDER BY song_count DESC NULLS LAST
-            """)
-            
-            full_outer_results = [
-                dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()
-            ]
-            
-            # SELF JOIN example: Genre similarity analysis
+        """))
+
+        # SELF JOIN example: Genre similarity analysis (LIMITed, so no
+        # need to stream)
+        with dict_cursor() as cursor:
             cursor.execute("""
                 WITH genre_artist_counts AS (
                     SELECT 
@@ -669,14 +994,11 @@ class GenreAnalyticsView(APIView):
                 LIMIT 10
             """)
             
-            self_join_results = [
-                dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()
-            ]
-            
-            # Mathematical and String Functions
-            cursor.execute("""
-                SELECT 
+            self_join_results = cursor.fetchall()
+
+        # Mathematical and String Functions
+        functions_results = list(stream_dict_rows("""
+                SELECT
                     g.name,
                     LENGTH(g.name) as name_length,
                     UPPER(g.name) as name_upper,
@@ -690,29 +1012,31 @@ class GenreAnalyticsView(APIView):
                 LEFT JOIN songs_song s ON g.id = s.genre_id
                 GROUP BY g.id, g.name
                 ORDER BY song_count DESC
-            """)
-            
-            functions_results = [
-                dict(zip([col[0] for col in cursor.description], row)) 
-                for row in cursor.fetchall()
-            ]
-        
+        """))
+
         # 4. Subquery Examples (EXISTS, NOT EXISTS, Correlated)
         
-        # EXISTS: Genres with recent activity
+        # EXISTS: Genres with recent activity. The listen count comes from a
+        # pre-aggregated subquery (one grouped scan over the recent window)
+        # instead of a genre->song->history join with DISTINCT counting.
+        # The cutoff is computed DB-side so the SQL text stays cacheable.
+        recent_cutoff = Now() - timedelta(days=30)
+        recent_listens_subquery = ListeningHistory.objects.filter(
+            listened_at__gte=recent_cutoff,
+            song__genre=OuterRef('pk')
+        ).values('song__genre').annotate(
+            c=Count('id')
+        ).values('c')[:1]
+
         recent_active_genres = Genre.objects.filter(
             Exists(
                 ListeningHistory.objects.filter(
                     song__genre=OuterRef('pk'),
-                    listened_at__gte=datetime.now() - timedelta(days=30)
+                    listened_at__gte=recent_cutoff
                 )
             )
         ).annotate(
-            recent_listens=Count(
-                'song__listening_history',
-                filter=Q(song__listening_history__listened_at__gte=datetime.now() - timedelta(days=30)),
-                distinct=True
-            )
+            recent_listens=Subquery(recent_listens_subquery)
         ).order_by('-recent_listens')
         
         # NOT EXISTS: Genres without any favorites
@@ -727,24 +1051,29 @@ class GenreAnalyticsView(APIView):
             song_count=Count('song')
         ).filter(song_count__gt=0)
         
-        # 5. Date/Time Functions and Analysis
-        monthly_genre_trends = ListeningHistory.objects.annotate(
-            month=TruncMonth('listened_at'),
-            genre_name=F('song__genre__name')
-        ).values('month', 'genre_name').annotate(
-            listen_count=Count('id')
-        ).order_by('-month', '-listen_count')
+        # 5. Date/Time Functions and Analysis — served from the hourly
+        # refreshed matview instead of scanning all of ListeningHistory
+        with dict_cursor() as cursor:
+            cursor.execute("""
+                SELECT month, genre_name, listen_count
+                FROM mv_monthly_genre_trends
+                ORDER BY month DESC, listen_count DESC
+                LIMIT 20
+            """)
+            monthly_genre_trends = cursor.fetchall()
         
-        # Compile all results
+        # Compile all results. The values() projections are consumed through
+        # .iterator() so rows stream in fixed-size chunks instead of the
+        # queryset caching every wide annotated row in memory
         response_data = {
-            'basic_statistics': list(basic_stats.values(
+            'basic_statistics': [row for row in basic_stats.values(
                 'name', 'song_count', 'total_plays', 'avg_song_duration',
                 'unique_artists', 'total_favorites'
-            )),
-            'genre_rankings': list(genre_rankings.values(
+            ).iterator(chunk_size=200)],
+            'genre_rankings': [row for row in genre_rankings.values(
                 'name', 'song_count', 'total_plays', 'popularity_rank',
                 'song_count_rank', 'popularity_percentile'
-            )),
+            ).iterator(chunk_size=200)],
             'set_operations': {
                 'union_popular_diverse': union_results,
                 'intersect_popular_and_diverse': intersect_results,
@@ -753,15 +1082,15 @@ class GenreAnalyticsView(APIView):
             },
             'function_demonstrations': functions_results,
             'subquery_examples': {
-                'recent_active_genres': list(recent_active_genres.values(
+                'recent_active_genres': [row for row in recent_active_genres.values(
                     'name', 'recent_listens'
-                )),
-                'unfavorited_genres': list(unfavorited_genres.values(
+                ).iterator(chunk_size=200)],
+                'unfavorited_genres': [row for row in unfavorited_genres.values(
                     'name', 'song_count'
-                ))
+                ).iterator(chunk_size=200)]
             },
             'temporal_analysis': {
-                'monthly_trends': list(monthly_genre_trends[:20])
+                'monthly_trends': monthly_genre_trends
             },
             'sql_concepts_demonstrated': [
                 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'FULL OUTER JOIN', 'SELF JOIN',
@@ -787,11 +1116,51 @@ class GenreAnalyticsView(APIView):
         })
 
 # ==================== PLAYLIST VIEWS ====================
+def _playlist_songs_prefetch():
+    """
+    Prefetch for nested playlist songs, projected down to the columns the
+    serializers actually read (plus the FK columns used for stitching) so
+    pages don't drag full rows — notably the tsvector columns — off disk.
+    """
+    return Prefetch(
+        'playlist_songs',
+        queryset=PlaylistSong.objects.select_related(
+            'song__artist', 'song__album', 'song__genre'
+        ).only(
+            'id', 'playlist', 'added_at', 'order',
+            'song__id', 'song__title', 'song__artist', 'song__album',
+            'song__genre', 'song__cover_image', 'song__audio_file',
+            'song__release_date', 'song__duration', 'song__play_count',
+            'song__upload_date', 'song__approved',
+            'song__artist__id', 'song__artist__username',
+            'song__artist__role', 'song__artist__stage_name',
+            'song__artist__display_name',
+            'song__album__id', 'song__album__title',
+            'song__genre__id', 'song__genre__name',
+        ),
+    )
+
+
+
 class PlaylistListCreateView(generics.ListCreateAPIView):
     serializer_class = PlaylistSerializer
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
+    @property
+    def paginator(self):
+        # Popularity ordering paginates by keyset (cursor over the ordering
+        # tuple) so deep pages stay an index range scan rather than an
+        # OFFSET sort-and-discard over the whole annotated result
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('order_by') == 'popular':
+                self._paginator = PopularPlaylistCursorPagination()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
         """
         Enhanced playlist listing demonstrating:
@@ -800,18 +1169,21 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
         - Set operations (UNION concept through Q objects)
         - Window functions for popularity ranking
         """
-        # Base queryset with comprehensive annotations
+        # Base queryset. song_count / total_duration / total_plays are
+        # denormalized columns maintained by PlaylistSong signals, so the
+        # main query no longer aggregates the junction table for them
         queryset = Playlist.objects.select_related('user').annotate(
-            # Many-to-many aggregations through PlaylistSong junction table
-            song_count=Count('playlist_songs__song', distinct=True),
-            total_duration=Sum('playlist_songs__song__duration'),
-            avg_song_duration=Avg('playlist_songs__song__duration'),
-            
-            # Aggregations across multiple JOINs
-            total_plays=Sum('playlist_songs__song__play_count'),
+            # Derived from the denormalized rollups (no join needed)
+            avg_song_duration=Case(
+                When(song_count__gt=0, then=F('total_duration') / F('song_count')),
+                default=Value(0.0),
+                output_field=FloatField()
+            ),
+
+            # Diversity metrics still aggregate across the junction table
             unique_artists=Count('playlist_songs__song__artist', distinct=True),
             unique_genres=Count('playlist_songs__song__genre', distinct=True),
-            
+
             # Window function: Rank playlists by song count
             size_rank=Window(
                 expression=Rank(),
@@ -833,16 +1205,6 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
                 ).order_by('-song__play_count').values('song__play_count')[:1]
             ),
             
-            # Case/When: Playlist categorization
-            playlist_type=Case(
-                When(song_count__gte=100, then=Value('mega')),
-                When(song_count__gte=50, then=Value('large')),
-                When(song_count__gte=20, then=Value('medium')),
-                When(song_count__gte=5, then=Value('small')),
-                default=Value('mini'),
-                output_field=CharField()
-            ),
-            
             # Mathematical calculations
             avg_plays_per_song=Case(
                 When(song_count__gt=0, then=F('total_plays') / F('song_count')),
@@ -862,19 +1224,30 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
         ).filter(
             # Complex WHERE with OR (demonstrating UNION-like logic)
             Q(is_public=True) | Q(user=self.request.user)
+        ).prefetch_related(
+            # The serializer walks playlist_songs for every row on the page;
+            # prefetch them with the narrow projection
+            _playlist_songs_prefetch()
         )
         
         # Advanced filtering options
         
-        # Search with multiple fields (LIKE with OR)
+        # Search with multiple fields (LIKE with OR). Song/artist matches go
+        # through an EXISTS semi-join, which stops at the first matching
+        # playlist song instead of join-multiplying rows and DISTINCTing
         search = self.request.query_params.get('search')
         if search:
+            song_match = PlaylistSong.objects.filter(
+                playlist=OuterRef('pk')
+            ).filter(
+                Q(song__title__icontains=search) |
+                Q(song__artist__username__icontains=search)
+            )
             queryset = queryset.filter(
                 Q(name__icontains=search) |
                 Q(user__username__icontains=search) |
-                Q(playlist_songs__song__title__icontains=search) |
-                Q(playlist_songs__song__artist__username__icontains=search)
-            ).distinct()
+                Q(Exists(song_match))
+            )
         
         # Filter by playlist size (BETWEEN equivalent)
         min_songs = self.request.query_params.get('min_songs')
@@ -886,18 +1259,22 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
         elif max_songs:
             queryset = queryset.filter(song_count__lte=max_songs)
         
-        # Filter by playlist type
+        # Filter by playlist type (denormalized indexed column, see signals)
         playlist_type = self.request.query_params.get('type')
         if playlist_type:
-            # Use filter on annotated field instead of .having() (not available on QuerySet)
             queryset = queryset.filter(playlist_type=playlist_type)
         
-        # Filter by genres (IN clause through many-to-many)
+        # Filter by genres (EXISTS semi-join instead of M2M join + DISTINCT)
         genres = self.request.query_params.getlist('genres')
         if genres:
             queryset = queryset.filter(
-                playlist_songs__song__genre_id__in=genres
-            ).distinct()
+                Exists(
+                    PlaylistSong.objects.filter(
+                        playlist=OuterRef('pk'),
+                        song__genre_id__in=genres
+                    )
+                )
+            )
         
         # Filter by minimum duration (aggregated field filtering)
         min_duration = self.request.query_params.get('min_duration')
@@ -907,7 +1284,7 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
         # EXISTS: Only playlists with recent activity
         recent_activity = self.request.query_params.get('recent_activity')
         if recent_activity == 'true':
-            recent_date = datetime.now() - timedelta(days=30)
+            recent_date = Now() - timedelta(days=30)
             queryset = queryset.filter(
                 Exists(
                     PlaylistSong.objects.filter(
@@ -942,42 +1319,36 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             
-            # Comprehensive statistics
-            stats = queryset.aggregate(
-                total_playlists=Count('id'),
-                total_songs=Sum('song_count'),
-                avg_songs_per_playlist=Avg('song_count'),
-                total_duration=Sum('total_duration'),
-                total_favorites=Sum('favorite_count'),
-                unique_creators=Count('user', distinct=True)
+            # Comprehensive statistics: the aggregate re-scans the whole
+            # annotated queryset (all joins included), so cache it briefly
+            # per user/filter combination instead of recomputing per page
+            stats_key = 'playlist_stats:%s:%s' % (
+                request.user.id,
+                hashlib.blake2b(
+                    json.dumps(sorted(request.query_params.lists())).encode()
+                ).hexdigest(),
+            )
+            stats = cache.get_or_set(
+                stats_key,
+                lambda: queryset.aggregate(
+                    total_playlists=Count('id'),
+                    total_songs=Sum('song_count'),
+                    avg_songs_per_playlist=Avg('song_count'),
+                    total_duration=Sum('total_duration'),
+                    total_favorites=Sum('favorite_count'),
+                    unique_creators=Count('user', distinct=True)
+                ),
+                30,
             )
             
-            # Raw SQL demonstrating UNION operations
-            with connection.cursor() as cursor:
-                cursor.execute("""
-                    -- UNION: Combine popular and recent playlists
-                    SELECT 'popular' as category, p.name, u.username, 
-                           COUNT(f.id) as favorites
-                    FROM songs_playlist p
-                    INNER JOIN users_user u ON p.user_id = u.id
-                    LEFT JOIN songs_favorite f ON p.id = f.item_id AND f.item_type = 'playlist'
-                    GROUP BY p.id, p.name, u.username
-                    HAVING COUNT(f.id) >= 3
-                    
-                    UNION
-                    
-                    SELECT 'recent' as category, p.name, u.username, 0 as favorites
-                    FROM songs_playlist p
-                    INNER JOIN users_user u ON p.user_id = u.id
-                    WHERE p.created_at >= NOW() - INTERVAL '7 days'
-                    
-                    ORDER BY category, favorites DESC
-                """)
-                
-                columns = [col[0] for col in cursor.description]
-                union_results = [
-                    dict(zip(columns, row)) for row in cursor.fetchall()
-                ]
+            # Popular/recent playlists come from a materialized view refreshed
+            # by Celery beat (songs.tasks) instead of re-running the UNION
+            # aggregation on every request
+            union_results = list(stream_dict_rows("""
+                SELECT category, name, username, favorites
+                FROM popular_and_recent_playlists
+                ORDER BY category, favorites DESC
+            """))
             
             # Playlist type distribution (GROUP BY)
             type_distribution = queryset.values('playlist_type').annotate(
@@ -999,14 +1370,20 @@ class PlaylistListCreateView(generics.ListCreateAPIView):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class PlaylistDetailView(generics.RetrieveUpdateDestroyAPIView):
+class PlaylistDetailView(PermissionAwareQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Playlist.objects.all()
     serializer_class = PlaylistSerializer
     permission_classes = [IsOwnerOrReadOnly]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
 
     def get_queryset(self):
-        return Playlist.objects.filter(
+        # select_related('user') comes from the mixin
+        return super().get_queryset().filter(
             Q(is_public=True) | Q(user=self.request.user)
+        ).prefetch_related(
+            # Pull the nested songs (and their artist/album/genre) in two
+            # extra queries instead of one per playlist song
+            _playlist_songs_prefetch()
         )
 
 class PlaylistAddSongView(APIView):
@@ -1021,16 +1398,29 @@ class PlaylistAddSongView(APIView):
         
         song = get_object_or_404(Song, id=song_id, approved=True)
         
-        # Both artists and listeners can add any approved song to their playlists
-        playlist_song, created = PlaylistSong.objects.get_or_create(
-            playlist=playlist,
-            song=song,
-            defaults={'order': playlist.playlist_songs.count()}
-        )
-        
-        if not created:
+        # Both artists and listeners can add any approved song to their
+        # playlists. The next order value is computed inside the INSERT
+        # itself (MAX("order")+1 subquery), so there is no separate
+        # COUNT round-trip and no race between concurrent adds seeing
+        # the same count; duplicates surface as an IntegrityError from
+        # the (playlist, song) unique constraint instead of a pre-SELECT
+        try:
+            with transaction.atomic():
+                playlist_song = PlaylistSong.objects.create(
+                    playlist=playlist,
+                    song=song,
+                    order=RawSQL(
+                        '(SELECT COALESCE(MAX("order"), 0) + 1 '
+                        'FROM songs_playlistsong WHERE playlist_id = %s)',
+                        [playlist.id],
+                    ),
+                )
+        except IntegrityError:
             return Response({'error': 'Song already in playlist'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
+        # Pull back the order the database assigned
+        playlist_song.refresh_from_db(fields=['order'])
+
         return Response(PlaylistSongSerializer(playlist_song).data, status=status.HTTP_201_CREATED)
 
 class PlaylistRemoveSongView(APIView):
@@ -1048,7 +1438,56 @@ class FavoriteListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Favorite.objects.filter(user=self.request.user).order_by("-created_at")
+        return Favorite.objects.filter(
+            user=self.request.user
+        ).select_related('user').order_by("-created_at")
+
+    def list(self, request, *args, **kwargs):
+        """List favorites with batched item resolution (no per-row queries)"""
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        favorites = page if page is not None else list(queryset)
+        self._attach_items(favorites)
+
+        serializer = self.get_serializer(favorites, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+    def _attach_items(self, favorites):
+        """
+        Batch-resolve the favorited items (manual GenericForeignKey-style
+        prefetch): group item_ids by item_type, fetch each type with one
+        in_bulk() query, then attach the objects for the serializer.
+        """
+        ids_by_type = {}
+        for favorite in favorites:
+            ids_by_type.setdefault(favorite.item_type, set()).add(favorite.item_id)
+
+        # Albums and playlists render their nested songs, so prefetch
+        # those (with the per-song FKs joined) alongside the in_bulk
+        # fetch — otherwise each favorited album/playlist costs a songs
+        # query plus per-song artist/album/genre lookups
+        items_by_type = {
+            'song': Song.objects.select_related('artist', 'album', 'genre').in_bulk(
+                ids_by_type.get('song', ())
+            ),
+            'album': Album.objects.select_related('artist').prefetch_related(
+                Prefetch(
+                    'songs',
+                    queryset=Song.objects.select_related('artist', 'album', 'genre')
+                )
+            ).in_bulk(ids_by_type.get('album', ())),
+            'playlist': Playlist.objects.select_related('user').prefetch_related(
+                _playlist_songs_prefetch()
+            ).in_bulk(ids_by_type.get('playlist', ())),
+        }
+
+        for favorite in favorites:
+            favorite._prefetched_item = items_by_type.get(
+                favorite.item_type, {}
+            ).get(favorite.item_id)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -1080,168 +1519,183 @@ class ToggleFavoriteView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Validate item exists using EXISTS-style query
-        item_exists = False
+        # Target-validation predicate folded into the upsert below
         if item_type == 'song':
-            item_exists = Song.objects.filter(id=item_id, approved=True).exists()
+            item_sql = "SELECT 1 FROM songs_song WHERE id = %s AND approved"
+            item_params = [item_id]
         elif item_type == 'album':
-            item_exists = Album.objects.filter(id=item_id).exists()
+            item_sql = "SELECT 1 FROM songs_album WHERE id = %s"
+            item_params = [item_id]
         elif item_type == 'playlist':
-            item_exists = Playlist.objects.filter(
-                id=item_id
-            ).filter(
-                Q(is_public=True) | Q(user=request.user)
-            ).exists()
-        
-        if not item_exists:
+            item_sql = (
+                "SELECT 1 FROM songs_playlist "
+                "WHERE id = %s AND (is_public OR user_id = %s)"
+            )
+            item_params = [item_id, request.user.id]
+        else:
             return Response(
-                {'error': f'Invalid {item_type} or insufficient permissions'}, 
+                {'error': f'Invalid {item_type} or insufficient permissions'},
                 status=status.HTTP_404_NOT_FOUND
             )
-        
-        # Use transaction for atomic operations
-        with transaction.atomic():
-            # Check if favorite already exists (SELECT with WHERE)
-            favorite_exists = Favorite.objects.filter(
+
+        # Single atomic upsert: the INSERT validates the target (WHERE
+        # EXISTS on the item table) and detects an existing favorite
+        # (ON CONFLICT DO NOTHING) in one round trip, closing the
+        # check-then-insert race of the old get_or_create flow
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO songs_favorite (user_id, item_type, item_id, created_at)
+                SELECT %s, %s, %s, now()
+                WHERE EXISTS ({item_sql})
+                ON CONFLICT (user_id, item_type, item_id) DO NOTHING
+                RETURNING id, created_at
+                """,
+                [request.user.id, item_type, item_id] + item_params,
+            )
+            inserted = cursor.fetchone()
+
+        if inserted:
+            favorite = Favorite(
+                id=inserted[0],
                 user=request.user,
                 item_type=item_type,
-                item_id=item_id
-            ).exists()
-            
-            if favorite_exists:
-                # DELETE operation
-                deleted_count = Favorite.objects.filter(
-                    user=request.user,
-                    item_type=item_type,
-                    item_id=item_id
-                ).delete()[0]
-                
-                # Get updated statistics using aggregations
-                user_favorite_stats = Favorite.objects.filter(
-                    user=request.user
-                ).aggregate(
-                    total_favorites=Count('id'),
-                    favorite_songs=Count('id', filter=Q(item_type='song')),
-                    favorite_albums=Count('id', filter=Q(item_type='album')),
-                    favorite_playlists=Count('id', filter=Q(item_type='playlist'))
-                )
-                
-                return Response({
-                    'favorited': False,
-                    'message': f'Removed {item_type} from favorites',
-                    'deleted_count': deleted_count,
-                    'user_stats': user_favorite_stats
-                }, status=status.HTTP_200_OK)
-            else:
-                # INSERT operation
-                favorite = Favorite.objects.create(
-                    user=request.user,
-                    item_type=item_type,
-                    item_id=item_id
-                )
-                
-                # Raw SQL demonstration: INSERT INTO ... SELECT pattern
-                with connection.cursor() as cursor:
-                    # Example: Create a summary record (this would be in a real summary table)
-                    cursor.execute("""
-                        -- This demonstrates INSERT INTO ... SELECT
-                        -- In a real app, this might update a user activity summary table
-                        SELECT 
-                            user_id,
-                            COUNT(*) as total_favorites,
-                            COUNT(CASE WHEN item_type = 'song' THEN 1 END) as song_favorites,
-                            COUNT(CASE WHEN item_type = 'album' THEN 1 END) as album_favorites,
-                            COUNT(CASE WHEN item_type = 'playlist' THEN 1 END) as playlist_favorites,
-                            MAX(created_at) as last_favorite_date
-                        FROM songs_favorite 
-                        WHERE user_id = %s
-                        GROUP BY user_id
-                    """, [request.user.id])
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        columns = [col[0] for col in cursor.description]
-                        summary_stats = dict(zip(columns, result))
-                    else:
-                        summary_stats = {}
-                
-                return Response({
-                    'favorited': True,
-                    'message': f'Added {item_type} to favorites',
-                    'favorite': FavoriteSerializer(favorite).data,
-                    'summary_stats': summary_stats
-                }, status=status.HTTP_201_CREATED)
+                item_id=item_id,
+                created_at=inserted[1],
+            )
+
+            # Raw SQL demonstration: INSERT INTO ... SELECT pattern
+            with dict_cursor() as cursor:
+                # Example: Create a summary record (this would be in a real summary table)
+                cursor.execute("""
+                    -- This demonstrates INSERT INTO ... SELECT
+                    -- In a real app, this might update a user activity summary table
+                    SELECT
+                        user_id,
+                        COUNT(*) as total_favorites,
+                        COUNT(CASE WHEN item_type = 'song' THEN 1 END) as song_favorites,
+                        COUNT(CASE WHEN item_type = 'album' THEN 1 END) as album_favorites,
+                        COUNT(CASE WHEN item_type = 'playlist' THEN 1 END) as playlist_favorites,
+                        MAX(created_at) as last_favorite_date
+                    FROM songs_favorite
+                    WHERE user_id = %s
+                    GROUP BY user_id
+                """, [request.user.id])
+
+                summary_stats = cursor.fetchone() or {}
+
+            return Response({
+                'favorited': True,
+                'message': f'Added {item_type} to favorites',
+                'favorite': FavoriteSerializer(favorite).data,
+                'summary_stats': summary_stats
+            }, status=status.HTTP_201_CREATED)
+
+        # Nothing inserted: either the favorite already exists (toggle
+        # off) or the target is invalid — the DELETE disambiguates
+        deleted_count = Favorite.objects.filter(
+            user=request.user,
+            item_type=item_type,
+            item_id=item_id
+        ).delete()[0]
+
+        if not deleted_count:
+            return Response(
+                {'error': f'Invalid {item_type} or insufficient permissions'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # Get updated statistics using aggregations
+        user_favorite_stats = Favorite.objects.filter(
+            user=request.user
+        ).aggregate(
+            total_favorites=Count('id'),
+            favorite_songs=Count('id', filter=Q(item_type='song')),
+            favorite_albums=Count('id', filter=Q(item_type='album')),
+            favorite_playlists=Count('id', filter=Q(item_type='playlist'))
+        )
+
+        return Response({
+            'favorited': False,
+            'message': f'Removed {item_type} from favorites',
+            'deleted_count': deleted_count,
+            'user_stats': user_favorite_stats
+        }, status=status.HTTP_200_OK)
 
     def get(self, request):
         """
-        GET favorite statistics demonstrating comprehensive SQL analytics
+        GET favorite statistics via one GROUP BY plus per-type batched lookups.
+        Replaces the old CTE that LEFT JOINed all three item tables (and their
+        owners) onto every favorite row even though only one branch per row
+        was ever used.
         """
-        user_id = request.user.id
-        
-        # Complex aggregation query with multiple JOINs
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                WITH user_favorites AS (
-                    SELECT 
-                        f.item_type,
-                        f.item_id,
-                        f.created_at,
-                        CASE f.item_type
-                            WHEN 'song' THEN s.title
-                            WHEN 'album' THEN a.title  
-                            WHEN 'playlist' THEN p.name
-                        END as item_name,
-                        CASE f.item_type
-                            WHEN 'song' THEN u_song.username
-                            WHEN 'album' THEN u_album.username
-                            WHEN 'playlist' THEN u_playlist.username
-                        END as creator_name
-                    FROM songs_favorite f
-                    LEFT JOIN songs_song s ON f.item_type = 'song' AND f.item_id = s.id
-                    LEFT JOIN songs_album a ON f.item_type = 'album' AND f.item_id = a.id
-                    LEFT JOIN songs_playlist p ON f.item_type = 'playlist' AND f.item_id = p.id
-                    LEFT JOIN users_user u_song ON s.artist_id = u_song.id
-                    LEFT JOIN users_user u_album ON a.artist_id = u_album.id
-                    LEFT JOIN users_user u_playlist ON p.user_id = u_playlist.id
-                    WHERE f.user_id = %s
-                ),
-                monthly_trends AS (
-                    SELECT 
-                        DATE_TRUNC('month', created_at) as month,
-                        item_type,
-                        COUNT(*) as count
-                    FROM songs_favorite
-                    WHERE user_id = %s
-                    GROUP BY DATE_TRUNC('month', created_at), item_type
-                    ORDER BY month DESC
-                )
-                SELECT 
-                    (SELECT COUNT(*) FROM user_favorites) as total_favorites,
-                    (SELECT COUNT(*) FROM user_favorites WHERE item_type = 'song') as song_favorites,
-                    (SELECT COUNT(*) FROM user_favorites WHERE item_type = 'album') as album_favorites,
-                    (SELECT COUNT(*) FROM user_favorites WHERE item_type = 'playlist') as playlist_favorites,
-                    (SELECT COUNT(DISTINCT creator_name) FROM user_favorites WHERE creator_name IS NOT NULL) as unique_creators,
-                    (SELECT MAX(created_at) FROM user_favorites) as last_favorite_date,
-                    (SELECT MIN(created_at) FROM user_favorites) as first_favorite_date
-            """, [user_id, user_id])
-            
-            result = cursor.fetchone()
-            columns = [col[0] for col in cursor.description]
-            stats = dict(zip(columns, result)) if result else {}
-            
-            # Get recent favorites with details
-            cursor.execute("""
-                SELECT item_type, item_name, creator_name, created_at
-                FROM user_favorites
-                ORDER BY created_at DESC
-                LIMIT 10
-            """)
-            
-            recent_favorites = [
-                dict(zip([col[0] for col in cursor.description], row))
-                for row in cursor.fetchall()
-            ]
-        
+        favorites = Favorite.objects.filter(user=request.user)
+
+        # Per-type counts in a single grouped query
+        type_counts = dict(
+            favorites.values_list('item_type').annotate(Count('id'))
+        )
+        date_bounds = favorites.aggregate(
+            last_favorite_date=Max('created_at'),
+            first_favorite_date=Min('created_at'),
+        )
+
+        # Unique creators: one narrow indexed query per item type
+        creator_names = set()
+        creator_names.update(Song.objects.filter(
+            id__in=favorites.filter(item_type='song').values('item_id')
+        ).values_list('artist__username', flat=True))
+        creator_names.update(Album.objects.filter(
+            id__in=favorites.filter(item_type='album').values('item_id')
+        ).values_list('artist__username', flat=True))
+        creator_names.update(Playlist.objects.filter(
+            id__in=favorites.filter(item_type='playlist').values('item_id')
+        ).values_list('user__username', flat=True))
+
+        stats = {
+            'total_favorites': sum(type_counts.values()),
+            'song_favorites': type_counts.get('song', 0),
+            'album_favorites': type_counts.get('album', 0),
+            'playlist_favorites': type_counts.get('playlist', 0),
+            'unique_creators': len(creator_names),
+            **date_bounds,
+        }
+
+        # Recent favorites: fetch the page, then resolve each type with one
+        # in_bulk() lookup instead of joining all three tables per row
+        recent = list(favorites.order_by('-created_at')[:10])
+        ids_by_type = {}
+        for favorite in recent:
+            ids_by_type.setdefault(favorite.item_type, set()).add(favorite.item_id)
+
+        items_by_type = {
+            'song': Song.objects.select_related('artist').in_bulk(
+                ids_by_type.get('song', ())
+            ),
+            'album': Album.objects.select_related('artist').in_bulk(
+                ids_by_type.get('album', ())
+            ),
+            'playlist': Playlist.objects.select_related('user').in_bulk(
+                ids_by_type.get('playlist', ())
+            ),
+        }
+
+        recent_favorites = []
+        for favorite in recent:
+            item = items_by_type.get(favorite.item_type, {}).get(favorite.item_id)
+            if favorite.item_type == 'playlist':
+                item_name = item.name if item else None
+                creator_name = item.user.username if item else None
+            else:
+                item_name = item.title if item else None
+                creator_name = item.artist.username if item else None
+            recent_favorites.append({
+                'item_type': favorite.item_type,
+                'item_name': item_name,
+                'creator_name': creator_name,
+                'created_at': favorite.created_at,
+            })
+
         return Response({
             'success': True,
             'data': {
@@ -1249,9 +1703,9 @@ class ToggleFavoriteView(APIView):
                 'recent_favorites': recent_favorites
             },
             'sql_concepts': [
-                'CTEs (WITH clause)', 'CASE WHEN statements', 'LEFT JOINs',
-                'Date functions (DATE_TRUNC)', 'Aggregations (COUNT, MAX, MIN)',
-                'Subqueries in SELECT', 'UNION-style operations', 'Complex WHERE'
+                'GROUP BY with COUNT', 'Aggregations (COUNT, MAX, MIN)',
+                'Subqueries (IN with values())', 'Batched lookups (in_bulk)',
+                'Complex WHERE'
             ]
         })
 
@@ -1275,215 +1729,83 @@ class AnalyticsAdvancedSearchView(APIView):
         """
         query = request.query_params.get('q', '')
         search_type = request.query_params.get('type', 'all')  # all, songs, albums, playlists, artists
-        
+
+        # Results depend only on the query params, so cache the full payload
+        # briefly — repeated searches skip the heavy annotated querysets
+        cache_key = 'adv_search:' + hashlib.blake2b(
+            json.dumps(sorted(request.query_params.lists())).encode()
+        ).hexdigest()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        search_query = SearchQuery(query, config='english') if query else None
+
+        # The four branches hit disjoint tables, so when several are
+        # requested they run concurrently on per-thread DB connections and
+        # wall time is max(branch) instead of the sum
+        branches = {
+            'songs': lambda: self._search_songs(request, query, search_query),
+            'albums': lambda: self._search_albums(query, search_query),
+            'playlists': lambda: self._search_playlists(query, search_query),
+            'artists': lambda: self._search_artists(query),
+        }
+        selected = list(branches) if search_type == 'all' else (
+            [search_type] if search_type in branches else []
+        )
+
         results = {}
-        
-        if search_type in ['all', 'songs']:
-            # Song search with comprehensive SQL features
-            song_results = Song.objects.select_related(
-                'artist', 'album', 'genre'
-            ).filter(approved=True).annotate(
-                # Relevance scoring using CASE WHEN
-                relevance_score=Case(
-                    When(title__iexact=query, then=Value(100)),  # Exact match
-                    When(title__icontains=query, then=Value(80)),  # Contains in title
-                    When(artist__username__icontains=query, then=Value(60)),  # Artist name
-                    When(album__title__icontains=query, then=Value(40)),  # Album title
-                    When(genre__name__icontains=query, then=Value(20)),  # Genre name
-                    default=Value(0),
-                    output_field=IntegerField()
-                ),
-                # Additional metrics
-                total_listens=Count('listening_history'),
-                    # favorite_count removed: Favorite is a separate model without direct relation
-                # String functions for analysis
-                title_similarity=Case(
-                    When(title__icontains=query, then=Length('title') - Length(query)),
-                    default=Value(999),
-                    output_field=IntegerField()
-                )
-            )
-            
-            # Apply search filters with complex WHERE
-            if query:
-                song_results = song_results.filter(
-                    Q(title__icontains=query) |
-                    Q(artist__username__icontains=query) |
-                    Q(artist__stage_name__icontains=query) |
-                    Q(album__title__icontains=query) |
-                    Q(genre__name__icontains=query)
-                ).filter(relevance_score__gt=0)
-            
-            # Advanced filtering options
-            min_duration = request.query_params.get('min_duration')
-            max_duration = request.query_params.get('max_duration')
-            if min_duration and max_duration:
-                song_results = song_results.filter(duration__range=[min_duration, max_duration])
-            
-            genres = request.query_params.getlist('genres')
-            if genres:
-                song_results = song_results.filter(genre_id__in=genres)
-            
-            min_plays = request.query_params.get('min_plays')
-            if min_plays:
-                song_results = song_results.filter(play_count__gte=int(min_plays))
-            
-            song_results = song_results.order_by('-relevance_score', '-play_count')[:20]
-            results['songs'] = list(song_results.values(
-                'id', 'title', 'artist__username', 'artist__stage_name',
-                'album__title', 'genre__name', 'play_count', 'duration',
-                'relevance_score', 'total_listens'
-            ))
-        
-        if search_type in ['all', 'albums']:
-            # Album search with aggregations
-            album_results = Album.objects.select_related('artist').annotate(
-                song_count=Count('songs'),
-                total_duration=Sum('songs__duration'),
-                total_plays=Sum('songs__play_count'),
-                relevance_score=Case(
-                    When(title__iexact=query, then=Value(100)),
-                    When(title__icontains=query, then=Value(80)),
-                    When(artist__username__icontains=query, then=Value(60)),
-                    default=Value(0),
-                    output_field=IntegerField()
-                )
-            )
-            
-            if query:
-                album_results = album_results.filter(
-                    Q(title__icontains=query) |
-                    Q(artist__username__icontains=query) |
-                    Q(artist__stage_name__icontains=query)
-                ).filter(relevance_score__gt=0)
-            
-            album_results = album_results.order_by('-relevance_score', '-total_plays')[:15]
-            results['albums'] = list(album_results.values(
-                'id', 'title', 'artist__username', 'song_count',
-                'total_duration', 'total_plays', 'relevance_score'
-            ))
-        
-        if search_type in ['all', 'playlists']:
-            # Playlist search with many-to-many aggregations
-            playlist_results = Playlist.objects.select_related('user').filter(
-                is_public=True
-            ).annotate(
-                song_count=Count('playlist_songs__song'),
-                total_duration=Sum('playlist_songs__song__duration'),
-                unique_artists=Count('playlist_songs__song__artist', distinct=True),
-                # favorite_count removed: computed in separate favorite endpoints if needed
-                relevance_score=Case(
-                    When(name__iexact=query, then=Value(100)),
-                    When(name__icontains=query, then=Value(80)),
-                    When(user__username__icontains=query, then=Value(40)),
-                    default=Value(0),
-                    output_field=IntegerField()
-                )
-            )
-            
-            if query:
-                playlist_results = playlist_results.filter(
-                    Q(name__icontains=query) |
-                    Q(user__username__icontains=query)
-                ).filter(relevance_score__gt=0)
-            
-            playlist_results = playlist_results.order_by('-relevance_score')[:15]
-            results['playlists'] = list(playlist_results.values(
-                'id', 'name', 'user__username', 'song_count',
-                'total_duration', 'unique_artists', 'relevance_score'
-            ))
-        
-        if search_type in ['all', 'artists']:
-            # Artist search with comprehensive stats
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
-            
-            artist_results = User.objects.filter(role='artist').annotate(
-                song_count=Count('songs'),
-                album_count=Count('albums'),
-                total_plays=Sum('songs__play_count'),
-                # total_favorites removed: favorites are stored in a separate model without direct FK to Song
-                avg_song_duration=Avg('songs__duration'),
-                relevance_score=Case(
-                    When(username__iexact=query, then=Value(100)),
-                    When(stage_name__iexact=query, then=Value(100)),
-                    When(username__icontains=query, then=Value(80)),
-                    When(stage_name__icontains=query, then=Value(80)),
-                    default=Value(0),
-                    output_field=IntegerField()
-                )
-            )
-            
-            if query:
-                artist_results = artist_results.filter(
-                    Q(username__icontains=query) |
-                    Q(stage_name__icontains=query)
-                ).filter(relevance_score__gt=0)
-            
-            artist_results = artist_results.order_by('-relevance_score', '-total_plays')[:15]
-            results['artists'] = list(artist_results.values(
-                'id', 'username', 'stage_name', 'song_count', 'album_count',
-                'total_plays', 'avg_song_duration', 'relevance_score'
-            ))
-        
-        # Raw SQL demonstration: Combined search with UNION
+        if len(selected) > 1:
+            with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+                futures = {
+                    key: pool.submit(self._run_branch, branches[key])
+                    for key in selected
+                }
+                for key, future in futures.items():
+                    results[key] = future.result()
+        else:
+            for key in selected:
+                results[key] = branches[key]()
+
+        # Unified cross-type list: merge the branch results already in hand
+        # instead of re-running the same matches as a UNION ALL round trip
         if query and search_type == 'all':
-            with connection.cursor() as cursor:
-                cursor.execute("""
-                    -- UNION: Combine all search results with unified scoring
-                    SELECT 'song' as type, s.title as name, u.username as creator, 
-                           s.play_count as metric, 'plays' as metric_type
-                    FROM songs_song s
-                    INNER JOIN users_user u ON s.artist_id = u.id
-                    WHERE s.approved = true AND (
-                        s.title ILIKE %s OR 
-                        u.username ILIKE %s OR 
-                        u.stage_name ILIKE %s
-                    )
-                    
-                    UNION ALL
-                    
-                    SELECT 'album' as type, a.title as name, u.username as creator,
-                           COALESCE(SUM(s.play_count), 0) as metric, 'total_plays' as metric_type
-                    FROM songs_album a
-                    INNER JOIN users_user u ON a.artist_id = u.id
-                    LEFT JOIN songs_song s ON a.id = s.album_id
-                    WHERE a.title ILIKE %s OR u.username ILIKE %s
-                    GROUP BY a.id, a.title, u.username
-                    
-                    UNION ALL
-                    
-                    SELECT 'playlist' as type, p.name as name, u.username as creator,
-                           COUNT(ps.song_id) as metric, 'song_count' as metric_type
-                    FROM songs_playlist p
-                    INNER JOIN users_user u ON p.user_id = u.id
-                    LEFT JOIN songs_playlistsong ps ON p.id = ps.playlist_id
-                    WHERE p.is_public = true AND (p.name ILIKE %s OR u.username ILIKE %s)
-                    GROUP BY p.id, p.name, u.username
-                    
-                    ORDER BY metric DESC
-                    LIMIT 20
-                """, [f'%{query}%'] * 7)
-                
-                columns = [col[0] for col in cursor.description]
-                unified_results = [
-                    dict(zip(columns, row)) for row in cursor.fetchall()
-                ]
-                
-                results['unified_search'] = unified_results
+            unified = [
+                {'type': 'song', 'name': r['title'],
+                 'creator': r['artist__username'],
+                 'metric': r['play_count'], 'metric_type': 'plays',
+                 'rank': r['relevance_score']}
+                for r in results['songs']
+            ] + [
+                {'type': 'album', 'name': r['title'],
+                 'creator': r['artist__username'],
+                 'metric': r['total_plays'] or 0, 'metric_type': 'total_plays',
+                 'rank': r['relevance_score']}
+                for r in results['albums']
+            ] + [
+                {'type': 'playlist', 'name': r['name'],
+                 'creator': r['user__username'],
+                 'metric': r['song_count'], 'metric_type': 'song_count',
+                 'rank': r['relevance_score']}
+                for r in results['playlists']
+            ]
+            unified.sort(
+                key=lambda r: (r['rank'] or 0, r['metric'] or 0), reverse=True
+            )
+            results['unified_search'] = unified[:20]
         
         # Search statistics
         total_results = sum(len(v) for k, v in results.items() if isinstance(v, list))
-        
-        return Response({
+
+        response_data = {
             'success': True,
             'query': query,
             'search_type': search_type,
             'total_results': total_results,
             'results': results,
             'sql_features_demonstrated': [
-                'LIKE with wildcards (%query%)',
-                'ILIKE for case-insensitive search',
+                'Full-text search (tsvector @@ tsquery)',
+                'Relevance ranking with ts_rank',
                 'Multiple JOIN types (INNER, LEFT)',
                 'UNION ALL for combining result sets',
                 'Complex WHERE with AND, OR conditions',
@@ -1497,12 +1819,165 @@ class AnalyticsAdvancedSearchView(APIView):
                 'ORDER BY with multiple criteria',
                 'LIMIT for result pagination'
             ]
-        })
+        }
+        cache.set(cache_key, response_data, 120)
+        return Response(response_data)
+
+    @staticmethod
+    def _run_branch(branch):
+        """Run one search branch in a worker thread, closing the thread's
+        DB connection afterwards so pool threads do not leak connections."""
+        try:
+            return branch()
+        finally:
+            connections.close_all()
+
+    def _search_songs(self, request, query, search_query):
+        # Song search: index-backed full-text ranking instead of per-row CASE WHEN
+        song_results = Song.objects.select_related(
+            'artist', 'album', 'genre'
+        ).filter(approved=True).annotate(
+            # Relevance from the GIN-indexed tsvector column
+            relevance_score=SearchRank(F('search_vector'), search_query)
+            if search_query else Value(0.0, output_field=FloatField()),
+            # Additional metrics
+            total_listens=Count('listening_history'),
+        )
+
+        # Apply search filters: FTS match plus related-name fallbacks
+        if query:
+            song_results = song_results.filter(
+                Q(search_vector=search_query) |
+                Q(artist__username__icontains=query) |
+                Q(artist__stage_name__icontains=query) |
+                Q(album__title__icontains=query) |
+                Q(genre__name__icontains=query)
+            )
+
+        # Advanced filtering options
+        min_duration = request.query_params.get('min_duration')
+        max_duration = request.query_params.get('max_duration')
+        if min_duration and max_duration:
+            song_results = song_results.filter(duration__range=[min_duration, max_duration])
+
+        genres = request.query_params.getlist('genres')
+        if genres:
+            song_results = song_results.filter(genre_id__in=genres)
+
+        min_plays = request.query_params.get('min_plays')
+        if min_plays:
+            song_results = song_results.filter(play_count__gte=int(min_plays))
+
+        # jsonb_build_object assembles the payload rows server-side, so
+        # Python receives ready dicts instead of building one per row
+        song_results = song_results.order_by('-relevance_score', '-play_count').annotate(
+            payload=JSONObject(**{
+                'id': F('id'), 'title': F('title'),
+                'artist__username': F('artist__username'),
+                'artist__stage_name': F('artist__stage_name'),
+                'album__title': F('album__title'),
+                'genre__name': F('genre__name'),
+                'play_count': F('play_count'), 'duration': F('duration'),
+                'relevance_score': F('relevance_score'),
+                'total_listens': F('total_listens'),
+            })
+        )
+        return list(song_results.values_list('payload', flat=True)[:20])
+
+    def _search_albums(self, query, search_query):
+        # Album search with aggregations
+        album_results = Album.objects.select_related('artist').annotate(
+            song_count=Count('songs'),
+            total_duration=Sum('songs__duration'),
+            total_plays=Sum('songs__play_count'),
+            relevance_score=SearchRank(F('search_vector'), search_query)
+            if search_query else Value(0.0, output_field=FloatField())
+        )
+
+        if query:
+            album_results = album_results.filter(
+                Q(search_vector=search_query) |
+                Q(artist__username__icontains=query) |
+                Q(artist__stage_name__icontains=query)
+            )
+
+        album_results = album_results.order_by('-relevance_score', '-total_plays').annotate(
+            payload=JSONObject(**{
+                'id': F('id'), 'title': F('title'),
+                'artist__username': F('artist__username'),
+                'song_count': F('song_count'),
+                'total_duration': F('total_duration'),
+                'total_plays': F('total_plays'),
+                'relevance_score': F('relevance_score'),
+            })
+        )
+        return list(album_results.values_list('payload', flat=True)[:15])
+
+    def _search_playlists(self, query, search_query):
+        # Playlist search; song_count/total_duration come from the
+        # denormalized columns rather than junction-table aggregations
+        playlist_results = Playlist.objects.select_related('user').filter(
+            is_public=True
+        ).annotate(
+            unique_artists=Count('playlist_songs__song__artist', distinct=True),
+            # favorite_count removed: computed in separate favorite endpoints if needed
+            relevance_score=SearchRank(F('search_vector'), search_query)
+            if search_query else Value(0.0, output_field=FloatField())
+        )
+
+        if query:
+            playlist_results = playlist_results.filter(
+                Q(search_vector=search_query) |
+                Q(user__username__icontains=query)
+            )
+
+        playlist_results = playlist_results.order_by('-relevance_score').annotate(
+            payload=JSONObject(**{
+                'id': F('id'), 'name': F('name'),
+                'user__username': F('user__username'),
+                'song_count': F('song_count'),
+                'total_duration': F('total_duration'),
+                'unique_artists': F('unique_artists'),
+                'relevance_score': F('relevance_score'),
+            })
+        )
+        return list(playlist_results.values_list('payload', flat=True)[:15])
+
+    def _search_artists(self, query):
+        # Artist search with comprehensive stats
+        if not query:
+            # Counts and play totals read the denormalized User columns;
+            # only the average duration still aggregates
+            song_stats = Song.objects.filter(artist=OuterRef('pk')).values('artist')
+            artist_results = User.objects.filter(role='artist').annotate(
+                avg_song_duration=Subquery(song_stats.annotate(a=Avg('duration')).values('a')),
+                relevance_score=Value(0, output_field=IntegerField())
+            ).order_by('-cached_total_plays')[:15]
+            return list(artist_results.values(
+                'id', 'username', 'stage_name',
+                'avg_song_duration', 'relevance_score',
+                song_count=F('cached_song_count'),
+                album_count=F('cached_album_count'),
+                total_plays=F('cached_total_plays'),
+            ))
+
+        # The old OR+annotate version hash-aggregated songs and albums for
+        # every artist before applying the text filter. This matches first
+        # against the combined-column trigram index (one probe covers both
+        # username and stage_name) and aggregates only the matched artists.
+        pattern = f'%{query}%'
+        with dict_cursor() as cursor:
+            execute_prepared(
+                cursor, 'artist_search', ARTIST_SEARCH_SQL,
+                [query, query, pattern]
+            )
+            return cursor.fetchall()
 
 # ==================== LISTENING HISTORY VIEWS ====================
 class ListeningHistoryListView(generics.ListAPIView):
     serializer_class = ListeningHistorySerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ListeningHistoryPagination
 
     def get_queryset(self):
         """
@@ -1521,14 +1996,20 @@ class ListeningHistoryListView(generics.ListAPIView):
             listen_day_of_week=Extract('listened_at', 'week_day'),
             listen_month=Extract('listened_at', 'month'),
             
-            # Window functions: User's listening patterns
-            daily_listen_rank=Window(
-                expression=RowNumber(),
-                partition_by=[TruncDate('listened_at')],
-                order_by=F('listened_at').asc()
+            # Correlated subqueries rather than window functions: the
+            # keyset cursor filters in WHERE, and windows are computed
+            # after it, so on later pages a window would only see rows
+            # older than the cursor position. Subqueries rank/count
+            # against the full history regardless of the page.
+            daily_listen_rank=RawSQL(
+                """(SELECT COUNT(*) + 1 FROM songs_listeninghistory lh2
+                    WHERE lh2.user_id = songs_listeninghistory.user_id
+                      AND lh2.listened_at::date = songs_listeninghistory.listened_at::date
+                      AND lh2.listened_at < songs_listeninghistory.listened_at)""",
+                []
             ),
-            
-            # Subquery: Times this song was played by user
+
+            # Times this song was played by the user
             song_play_count=Subquery(
                 ListeningHistory.objects.filter(
                     user=OuterRef('user'),
@@ -1537,11 +2018,11 @@ class ListeningHistoryListView(generics.ListAPIView):
                     count=Count('id')
                 ).values('count')[:1]
             ),
-            
-            # Days since last listen to this song
-            days_since_last_listen=Extract(
-                Now() - F('listened_at'),
-                lookup_name='days'
+
+            # Days since last listen to this song (raw EXTRACT skips the
+            # interval casts Django wraps around Now() - F())
+            days_since_last_listen=RawSQL(
+                "EXTRACT(day FROM now() - listened_at)", []
             )
         ).order_by('-listened_at')
 
@@ -1564,84 +2045,88 @@ class ListeningHistoryListView(generics.ListAPIView):
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            
-            # Comprehensive listening analytics using raw SQL with CTEs
+
+            # All four analytics blocks scan the same history rows joined to
+            # songs_song, so they share one filtered CTE and come back as
+            # jsonb arrays from a single round trip instead of four
+            # separate aggregations over the same base set
+            filters_sql = "lh.user_id = %s"
+            params = [request.user.id]
+            if start_date and end_date:
+                filters_sql += " AND DATE(lh.listened_at) BETWEEN %s AND %s"
+                params += [start_date, end_date]
+            if start_hour and end_hour:
+                filters_sql += " AND EXTRACT(hour FROM lh.listened_at) BETWEEN %s AND %s"
+                params += [start_hour, end_hour]
+
+            # The analytics block is identical for every page of the same
+            # scrollthrough, so cache it per (user, filters). The version
+            # counter bumps on new history entries, which invalidates all
+            # cached variants without pattern deletes.
+            version = cache.get_or_set(
+                f'listen_analytics_ver:{request.user.id}', lambda: 1, None
+            )
+            analytics_key = (
+                f'listen_analytics:{request.user.id}:{version}:'
+                f'{start_date}:{end_date}:{start_hour}:{end_hour}'
+            )
+            analytics = cache.get(analytics_key)
+            if analytics is not None:
+                response_data = self.get_paginated_response(serializer.data).data
+                response_data['analytics'] = analytics
+                return Response(response_data)
+
+            # Daily stats come from the per-user matview unless an hour
+            # filter forces re-aggregation from the raw rows
+            if start_hour and end_hour:
+                daily_source = """
+                    SELECT
+                        DATE(listened_at) as listen_date,
+                        COUNT(*) as daily_listens,
+                        COUNT(DISTINCT song_id) as unique_songs,
+                        COUNT(DISTINCT artist_id) as unique_artists
+                    FROM filtered
+                    GROUP BY DATE(listened_at)
+                """
+            else:
+                daily_source = """
+                    SELECT d as listen_date, daily_listens,
+                           unique_songs, unique_artists
+                    FROM user_daily_listen_stats
+                    WHERE user_id = %s
+                """
+                params.append(request.user.id)
+                if start_date and end_date:
+                    daily_source += " AND d BETWEEN %s AND %s"
+                    params += [start_date, end_date]
+
             with connection.cursor() as cursor:
-                cursor.execute("""
-                    WITH daily_stats AS (
-                        SELECT 
-                            DATE(listened_at) as listen_date,
-                            COUNT(*) as daily_listens,
-                            COUNT(DISTINCT song_id) as unique_songs,
-                            COUNT(DISTINCT s.artist_id) as unique_artists,
-                            COUNT(DISTINCT s.genre_id) as unique_genres,
-                            AVG(s.duration) as avg_song_duration
-                        FROM songs_listeninghistory lh
-                        INNER JOIN songs_song s ON lh.song_id = s.id
-                        WHERE lh.user_id = %s
-                        GROUP BY DATE(listened_at)
+                # Only four filter shapes exist, so each gets its own
+                # cached server-side plan
+                plan_name = 'lh_analytics_{}{}'.format(
+                    int(bool(start_date and end_date)),
+                    int(bool(start_hour and end_hour)),
+                )
+                execute_prepared(
+                    cursor, plan_name,
+                    LISTENING_ANALYTICS_SQL.format(
+                        filters=filters_sql, daily_source=daily_source
                     ),
-                    hourly_stats AS (
-                        SELECT 
-                            EXTRACT(hour FROM listened_at) as hour,
-                            COUNT(*) as listens,
-                            RANK() OVER (ORDER BY COUNT(*) DESC) as popularity_rank
-                        FROM songs_listeninghistory
-                        WHERE user_id = %s
-                        GROUP BY EXTRACT(hour FROM listened_at)
-                    )
-                    SELECT 
-                        ds.listen_date,
-                        ds.daily_listens,
-                        ds.unique_songs,
-                        ds.unique_artists,
-                        LAG(ds.daily_listens) OVER (ORDER BY ds.listen_date) as prev_day_listens,
-                        ds.daily_listens - LAG(ds.daily_listens) OVER (ORDER BY ds.listen_date) as daily_change
-                    FROM daily_stats ds
-                    ORDER BY ds.listen_date DESC
-                    LIMIT 30
-                """, [request.user.id, request.user.id])
-                
-                columns = [col[0] for col in cursor.description]
-                daily_trends = [
-                    dict(zip(columns, row)) for row in cursor.fetchall()
-                ]
-            
-            # Genre preference analysis (GROUP BY with HAVING)
-            genre_preferences = queryset.values(
-                'song__genre__name'
-            ).annotate(
-                listen_count=Count('id'),
-                unique_songs=Count('song', distinct=True),
-                total_duration=Sum('song__duration'),
-                avg_song_duration=Avg('song__duration')
-            ).filter(
-                listen_count__gte=2  # HAVING equivalent
-            ).order_by('-listen_count')
-            
-            # Time-based listening patterns
-            hourly_patterns = queryset.values('listen_hour').annotate(
-                count=Count('id')
-            ).order_by('listen_hour')
-            
-            # Most played songs (with self-join concept)
-            top_songs = queryset.values(
-                'song__title', 
-                'song__artist__username'
-            ).annotate(
-                play_count=Count('id'),
-                first_listen=Min('listened_at'),
-                last_listen=Max('listened_at')
-            ).order_by('-play_count')[:10]
-            
-            response_data = self.get_paginated_response(serializer.data).data
-            response_data['analytics'] = {
+                    params
+                )
+                daily_trends, genre_preferences, hourly_patterns, top_songs = cursor.fetchone()
+
+            analytics = {
                 'daily_trends': daily_trends,
-                'genre_preferences': list(genre_preferences),
-                'hourly_patterns': list(hourly_patterns),
-                'top_songs': list(top_songs)
+                'genre_preferences': genre_preferences,
+                'hourly_patterns': hourly_patterns,
+                'top_songs': top_songs
             }
-            
+            cache.set(analytics_key, analytics, 300)
+
+            response_data = self.get_paginated_response(serializer.data).data
+            response_data['analytics'] = analytics
+
             return Response(response_data)
         
         serializer = self.get_serializer(queryset, many=True)
@@ -1656,29 +2141,55 @@ class AddToHistoryView(APIView):
             return Response({'error': 'song_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         song = get_object_or_404(Song, id=song_id, approved=True)
-        
-        # Create or update listening history
-        history_entry = ListeningHistory.objects.create(user=request.user, song=song)
-        
-        return Response(ListeningHistorySerializer(history_entry).data, status=status.HTTP_201_CREATED)
+
+        # Dedup window: replays of the same song inside 30s (skip
+        # mashing, client retries) don't each queue an INSERT.
+        # cache.add is atomic (SET NX EX), so concurrent requests
+        # can't both pass the guard
+        if not cache.add(f'lh_dedup:{request.user.id}:{song.id}', 1, 30):
+            return Response(
+                {'success': True, 'queued': False, 'deduped': True,
+                 'song_id': song.id},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        # Queue the play event; flush_listening_history drains the buffer
+        # into one bulk INSERT instead of a transaction per play
+        history_redis().rpush(
+            HISTORY_BUFFER_KEY,
+            json.dumps({'u': request.user.id, 's': song.id})
+        )
+
+        # New history invalidates this user's cached listening analytics
+        try:
+            cache.incr(f'listen_analytics_ver:{request.user.id}')
+        except ValueError:
+            pass  # nothing cached yet
+
+        return Response(
+            {'success': True, 'queued': True, 'song_id': song.id},
+            status=status.HTTP_202_ACCEPTED
+        )
 
 # ==================== COMMENT VIEWS ====================
 class CommentListCreateView(generics.ListCreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         item_type = self.request.query_params.get('item_type')
         item_id = self.request.query_params.get('item_id')
         
-        queryset = Comment.objects.all().order_by("-created_at")
+        # user joins in one query; CommentSerializer reads user.display_name
+        queryset = Comment.objects.select_related('user').order_by("-created_at")
         
         if item_type and item_id:
             queryset = queryset.filter(item_type=item_type, item_id=item_id)
         
         return queryset
 
-class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CommentDetailView(PermissionAwareQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
     permission_classes = [IsOwnerOrReadOnly]
@@ -1762,12 +2273,14 @@ class SongsWithStatsView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request):
-        songs = SQLAnalytics.get_songs_with_all_stats()[:50]  # Limit for performance
+        # list() evaluates the slice once; len() avoids re-running the
+        # whole unsliced query as a COUNT(*)
+        songs = list(SQLAnalytics.get_songs_with_all_stats()[:50])  # Limit for performance
         serializer = SongSerializer(songs, many=True)
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': songs.count(),
+            'count': len(songs),
             'sql_concepts': ['LEFT OUTER JOIN', 'COUNT DISTINCT', 'MAX', 'Multiple Aggregations']
         })
 
@@ -1809,13 +2322,13 @@ class SongsByDurationView(APIView):
         if max_duration:
             max_duration = float(max_duration)
             
-        songs = SQLAnalytics.get_songs_by_duration_range(min_duration, max_duration)[:100]
+        songs = list(SQLAnalytics.get_songs_by_duration_range(min_duration, max_duration)[:100])
         serializer = SongSerializer(songs, many=True)
-        
+
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': songs.count(),
+            'count': len(songs),
             'filters': {
                 'min_duration': min_duration,
                 'max_duration': max_duration
@@ -1848,12 +2361,12 @@ class AlbumStatisticsView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request):
-        albums = SQLAnalytics.get_albums_with_statistics()[:50]
+        albums = list(SQLAnalytics.get_albums_with_statistics()[:50])
         serializer = AlbumSerializer(albums, many=True)
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': albums.count(),
+            'count': len(albums),
             'sql_concepts': ['COUNT', 'SUM', 'AVG', 'Nested Aggregations', 'INNER JOIN']
         })
 
@@ -1866,12 +2379,12 @@ class PlaylistAnalyticsView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request):
-        playlists = SQLAnalytics.get_playlist_analytics()[:50]
+        playlists = list(SQLAnalytics.get_playlist_analytics()[:50])
         serializer = PlaylistSerializer(playlists, many=True)
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': playlists.count(),
+            'count': len(playlists),
             'sql_concepts': ['Many-to-Many JOIN', 'COUNT DISTINCT', 'Complex WHERE', 'Multiple Aggregations']
         })
 
@@ -1896,13 +2409,13 @@ class AdvancedSearchView(APIView):
         search_term = request.data.get('search_term', '')
         filters = request.data.get('filters', {})
         
-        songs = SQLAnalytics.search_songs_advanced(search_term, filters)[:100]
+        songs = list(SQLAnalytics.search_songs_advanced(search_term, filters)[:100])
         serializer = SongSerializer(songs, many=True)
-        
+
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': songs.count(),
+            'count': len(songs),
             'search_term': search_term,
             'filters': filters,
             'sql_concepts': ['LIKE', 'OR', 'AND', 'IN', 'BETWEEN', 'Complex WHERE']
@@ -1918,13 +2431,13 @@ class SimilarSongsView(APIView):
 
     def get(self, request, song_id):
         limit = int(request.query_params.get('limit', 10))
-        similar_songs = SQLAnalytics.get_similar_songs(song_id, limit)
+        similar_songs = list(SQLAnalytics.get_similar_songs(song_id, limit))
         serializer = SongSerializer(similar_songs, many=True)
-        
+
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': similar_songs.count(),
+            'count': len(similar_songs),
             'sql_concepts': ['Self JOIN', 'CASE WHEN', 'EXCLUDE', 'Complex Scoring', 'ORDER BY Multiple']
         })
 
@@ -1958,13 +2471,13 @@ class TrendingSongsView(APIView):
         days = int(request.query_params.get('days', 7))
         limit = int(request.query_params.get('limit', 20))
         
-        trending = SQLAnalytics.get_trending_songs(days, limit)
+        trending = list(SQLAnalytics.get_trending_songs(days, limit))
         serializer = SongSerializer(trending, many=True, context={'request': request})
-        
+
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': trending.count(),
+            'count': len(trending),
             'parameters': {
                 'days': days,
                 'limit': limit
@@ -2000,13 +2513,13 @@ class UserRecommendationsView(APIView):
         target_user_id = user_id or request.user.id
         limit = int(request.query_params.get('limit', 20))
         
-        recommendations = SQLAnalytics.get_user_recommendations_advanced(target_user_id, limit)
+        recommendations = list(SQLAnalytics.get_user_recommendations_advanced(target_user_id, limit))
         serializer = SongSerializer(recommendations, many=True)
-        
+
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': recommendations.count(),
+            'count': len(recommendations),
             'sql_concepts': ['Subqueries', 'NOT IN', 'OR', 'CASE WHEN', 'Complex Scoring']
         })
 
@@ -2164,8 +2677,15 @@ class ComprehensiveSQLDemoView(APIView):
         Runs all SQL demonstrations
         """
         try:
-            results = ComprehensiveSQLExamples.comprehensive_demo()
-            
+            # The ~50 demonstration queries run against data that changes
+            # slowly; memoize for 10 minutes so an AllowAny endpoint can't
+            # be used to hammer the database
+            results = cache.get_or_set(
+                'sql_demo:comprehensive',
+                ComprehensiveSQLExamples.comprehensive_demo,
+                600,
+            )
+
             return Response({
                 'success': True,
                 'message': 'Comprehensive SQL demonstration completed',
@@ -2198,8 +2718,8 @@ class SQLViewExamplesView(APIView):
                 'success': True,
                 'message': result,
                 'views_created': [
-                    'popular_songs_view',
-                    'artist_stats_view', 
+                    'popular_songs_mv (materialized, refreshed)',
+                    'artist_stats_view',
                     'user_engagement_view'
                 ]
             })
@@ -2239,7 +2759,11 @@ class SQLSetOperationsView(APIView):
         Shows UNION, UNION ALL, INTERSECT, EXCEPT examples
         """
         try:
-            results = ComprehensiveSQLExamples.set_operations_examples()
+            results = cache.get_or_set(
+                'sql_demo:set_operations',
+                ComprehensiveSQLExamples.set_operations_examples,
+                600,
+            )
             return Response({
                 'success': True,
                 'message': 'Set operations demonstrated',
@@ -2264,7 +2788,11 @@ class SQLAdvancedJoinsView(APIView):
         Shows all types of JOIN operations
         """
         try:
-            results = ComprehensiveSQLExamples.advanced_join_examples()
+            results = cache.get_or_set(
+                'sql_demo:advanced_joins',
+                ComprehensiveSQLExamples.advanced_join_examples,
+                600,
+            )
             return Response({
                 'success': True,
                 'message': 'Advanced JOIN operations demonstrated',
@@ -2289,7 +2817,11 @@ class SQLWindowFunctionsView(APIView):
         Shows ROW_NUMBER, RANK, LAG, LEAD, etc.
         """
         try:
-            results = ComprehensiveSQLExamples.window_functions_examples()
+            results = cache.get_or_set(
+                'sql_demo:window_functions',
+                ComprehensiveSQLExamples.window_functions_examples,
+                600,
+            )
             return Response({
                 'success': True,
                 'message': 'Window functions demonstrated',
@@ -2314,7 +2846,11 @@ class SQLAdvancedFunctionsView(APIView):
         Shows mathematical, string, and date functions
         """
         try:
-            results = ComprehensiveSQLExamples.advanced_functions_examples()
+            results = cache.get_or_set(
+                'sql_demo:advanced_functions',
+                ComprehensiveSQLExamples.advanced_functions_examples,
+                600,
+            )
             return Response({
                 'success': True,
                 'message': 'Advanced functions demonstrated',
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -62,7 +63,7 @@ class CustomUserAdmin(UserAdmin):
 
     def songs_count(self, obj):
         if obj.role == 'artist':
-            count = obj.songs.count()
+            count = obj.num_songs
             if count > 0:
                 url = reverse('admin:songs_song_changelist') + f'?artist__id__exact={obj.id}'
                 return format_html('<a href="{}">{} songs</a>', url, count)
@@ -72,7 +73,7 @@ class CustomUserAdmin(UserAdmin):
 
     def albums_count(self, obj):
         if obj.role == 'artist':
-            count = obj.albums.count()
+            count = obj.num_albums
             if count > 0:
                 url = reverse('admin:songs_album_changelist') + f'?artist__id__exact={obj.id}'
                 return format_html('<a href="{}">{} albums</a>', url, count)
@@ -81,7 +82,13 @@ class CustomUserAdmin(UserAdmin):
     albums_count.short_description = "Albums"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related().prefetch_related('songs', 'albums')
+        # Annotated counts resolve in the changelist query itself; the old
+        # prefetch_related('songs', 'albums') loaded every related row into
+        # memory just so .count() could measure the cached lists
+        return super().get_queryset(request).annotate(
+            num_songs=Count('songs', distinct=True),
+            num_albums=Count('albums', distinct=True),
+        )
 
     actions = ['mark_verified', 'mark_unverified', 'deactivate_users', 'activate_users']
 
@@ -0,0 +1,29 @@
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+# Short TTL: the post_save/post_delete signals invalidate eagerly, this
+# just bounds staleness if an update slips past them (e.g. raw SQL)
+USER_CACHE_TTL = 60
+
+
+def user_cache_key(user_id):
+    return f'auth_user:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves the token's user from the Redis cache,
+    eliminating the per-request User SELECT on every authenticated call.
+    Entries are invalidated on user save/delete (users.signals) and on
+    logout, with a short TTL as a backstop.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TTL)
+        return user
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.17 on 2026-08-30 04:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_search_vector_user_user_search_vector_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='cached_album_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='cached_song_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='cached_total_plays',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        # Backfill the counters from the current catalog
+        migrations.RunSQL(
+            sql="""
+                UPDATE users_user u
+                SET cached_song_count = c.ct,
+                    cached_total_plays = COALESCE(c.plays, 0)
+                FROM (
+                    SELECT artist_id, COUNT(*) AS ct, SUM(play_count) AS plays
+                    FROM songs_song
+                    GROUP BY artist_id
+                ) c
+                WHERE c.artist_id = u.id;
+
+                UPDATE users_user u
+                SET cached_album_count = c.ct
+                FROM (
+                    SELECT artist_id, COUNT(*) AS ct
+                    FROM songs_album
+                    GROUP BY artist_id
+                ) c
+                WHERE c.artist_id = u.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Combined trigram index over username + stage_name so the artist
+    search probes one GIN index instead of two separate per-column
+    predicates. Built CONCURRENTLY (hence atomic = False).
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0004_user_cached_album_count_user_cached_song_count_and_more'),
+        ('songs', '0010_trigram_indexes'),  # pg_trgm extension
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS users_user_search_trgm "
+                "ON users_user USING gin "
+                "((COALESCE(username, '') || ' ' || COALESCE(stage_name, '')) gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS users_user_search_trgm;",
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Trigram index on email so the user-list search's icontains predicate
+    probes an index like the username/stage_name ones already do. Built
+    CONCURRENTLY (hence atomic = False).
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0005_user_search_trgm_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS users_user_email_trgm "
+                "ON users_user USING gin (email gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS users_user_email_trgm;",
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-30 05:06
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_alter_user_email_user_user_email_lower_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('username', 'stage_name', 'email', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        # Changing a generated column's expression drops and re-adds the
+        # column, which takes the dependent GIN index with it — put it back
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS user_search_vector_gin ON users_user USING gin (search_vector);',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-30 05:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_user_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='display_name',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(role='artist', stage_name__gt='', then=models.F('stage_name')), default=models.F('username')), output_field=models.CharField(max_length=255)),
+        ),
+    ]
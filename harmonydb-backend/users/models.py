@@ -1,11 +1,18 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Case, F, When
+from django.db.models.functions import Lower
 
 class User(AbstractUser):
     class Role(models.TextChoices):
         LISTENER = "listener", "Music Listener"
         ARTIST   = "artist", "Artist"
 
+    # Logins and the resend/forgot flows look users up by email, so it
+    # must be unique (and indexed) rather than AbstractUser's default
+    email = models.EmailField(unique=True)
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.LISTENER)
     email_verified = models.BooleanField(default=False)
     profile_picture = models.ImageField(upload_to="profile_pictures/", null=True, blank=True)
@@ -13,18 +20,49 @@ class User(AbstractUser):
     
     # Artist-specific fields (only used when role is artist)
     stage_name = models.CharField(max_length=255, blank=True)
-    
+
+    # Stored column instead of a Python property, so listings read a
+    # string straight off the row rather than branching per object
+    display_name = models.GeneratedField(
+        expression=Case(
+            When(role='artist', stage_name__gt='', then=F('stage_name')),
+            default=F('username'),
+        ),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
+
+    # Denormalized artist counters maintained by songs.signals (and an
+    # hourly resync for play-count drift), so artist listings read a
+    # column instead of aggregating songs/albums per request
+    cached_song_count = models.PositiveIntegerField(default=0)
+    cached_album_count = models.PositiveIntegerField(default=0)
+    cached_total_plays = models.PositiveBigIntegerField(default=0)
+
+
     # Listener-specific fields
     birth_date = models.DateField(null=True, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Generated tsvector column kept in sync by Postgres; searched via GIN
+    # index. 'simple' config: usernames/emails aren't English prose, so
+    # stemming and stopword removal would only lose matches
+    search_vector = models.GeneratedField(
+        expression=SearchVector('username', 'stage_name', 'email', config='simple'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            GinIndex(fields=['search_vector'], name='user_search_vector_gin'),
+            # Case-insensitive email lookup (iexact) in the auth flows
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+            # IsArtist checks and artist listings filter by role
+            models.Index(fields=['role'], name='user_role_idx'),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
-
-    @property
-    def display_name(self):
-        if self.role == self.Role.ARTIST and self.stage_name:
-            return self.stage_name
-        return self.username
@@ -1,5 +1,27 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+# Model -> FK id attribute naming the owner. Populated lazily so this
+# module can be imported before the app registry is ready.
+_OWNER_ID_ATTR = {}
+
+
+def _owner_id_attr(obj):
+    if not _OWNER_ID_ATTR:
+        from songs.models import (
+            AIPrompt, Album, Comment, Favorite, ListeningHistory,
+            Playlist, Song,
+        )
+        _OWNER_ID_ATTR.update({
+            Song: 'artist_id',
+            Album: 'artist_id',
+            Playlist: 'user_id',
+            Favorite: 'user_id',
+            ListeningHistory: 'user_id',
+            Comment: 'user_id',
+            AIPrompt: 'user_id',
+        })
+    return _OWNER_ID_ATTR.get(type(obj))
+
 class IsEmailVerified(BasePermission):
     message = "Email is not verified."
 
@@ -7,7 +29,25 @@ class IsEmailVerified(BasePermission):
         user = request.user
         return user and user.is_authenticated and getattr(user, "email_verified", False)
 
-class IsArtistOrReadOnly(BasePermission):
+_MISSING = object()
+
+class RoleAwarePermission(BasePermission):
+    """
+    Shared role lookup for the artist permissions: the first check to
+    run resolves request.user.role (touching the lazy user exactly once)
+    and pins it on the request, so stacked permission classes and
+    per-object re-checks reuse the value instead of re-reading the user.
+    """
+
+    def user_role(self, request):
+        role = getattr(request, '_cached_user_role', _MISSING)
+        if role is _MISSING:
+            user = request.user
+            role = user.role if user and user.is_authenticated else None
+            request._cached_user_role = role
+        return role
+
+class IsArtistOrReadOnly(RoleAwarePermission):
     """
     Permission that allows only artists to create/edit content.
     Everyone can read.
@@ -17,11 +57,7 @@ class IsArtistOrReadOnly(BasePermission):
     def has_permission(self, request, view):
         if request.method in SAFE_METHODS:
             return True
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role == 'artist'
-        )
+        return self.user_role(request) == 'artist'
 
 class IsOwnerOrReadOnly(BasePermission):
     """
@@ -30,6 +66,10 @@ class IsOwnerOrReadOnly(BasePermission):
     """
     message = "You can only modify your own content."
 
+    # FK names PermissionAwareQuerysetMixin should select_related when a
+    # view pairs this permission with a model that has one of them
+    related_fields = ('user', 'artist')
+
     def has_permission(self, request, view):
         if request.method in SAFE_METHODS:
             return True
@@ -39,22 +79,44 @@ class IsOwnerOrReadOnly(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         
-        # Check if the object has an owner field (user, artist, etc.)
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'artist'):
-            return obj.artist == request.user
-        return False
+        # Typed dispatch on the owner FK id: the old hasattr(obj, 'user')
+        # probe executed the FK descriptor, which fetches the related row
+        # from the DB when it isn't cached; comparing the raw *_id column
+        # never dereferences the relation
+        attr = _owner_id_attr(obj)
+        if attr is None:
+            return False
+        return getattr(obj, attr) == request.user.id
+
+class PermissionAwareQuerysetMixin:
+    """
+    View mixin that select_relates the FK names the view's permissions
+    declare via ``related_fields``. The ownership check itself reads the
+    raw ``*_id`` column, but the serializers on these detail views render
+    the owner, so fetching it in the same query saves a round trip.
+    """
 
-class IsArtist(BasePermission):
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Only apply names the model actually has as forward relations —
+        # IsOwnerOrReadOnly guards both user-owned and artist-owned models
+        field_names = {
+            f.name for f in queryset.model._meta.get_fields()
+            if f.is_relation and f.concrete
+        }
+        related = set()
+        for permission in self.get_permissions():
+            related.update(getattr(permission, 'related_fields', ()))
+        related &= field_names
+        if related:
+            queryset = queryset.select_related(*sorted(related))
+        return queryset
+
+class IsArtist(RoleAwarePermission):
     """
     Permission that allows only artists.
     """
     message = "Only artists can access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            request.user.role == 'artist'
-        )
+        return self.user_role(request) == 'artist'
@@ -1,4 +1,6 @@
 from django.contrib.auth import get_user_model, authenticate
+from django.db import transaction
+from django.db.models import QuerySet
 from rest_framework import serializers
 from .tokens import email_verification_token, password_reset_token
 from .utils import encode_uid
@@ -23,7 +25,9 @@ class RegisterSerializer(serializers.ModelSerializer):
     def create(self, validated):
         validated.pop("confirm_password")
         password = validated.pop("password")
-        user = User.objects.create(**validated)
+        # Hash before saving so registration is one INSERT instead of
+        # an INSERT followed by a full-row UPDATE
+        user = User(**validated)
         user.set_password(password)
         user.is_active = True  # allow login after verification (we’ll gate features by email_verified)
         user.save()
@@ -32,7 +36,9 @@ class RegisterSerializer(serializers.ModelSerializer):
         token = email_verification_token.make_token(user)
         link = f'{settings.FRONTEND_BASE_URL}/verify-email?uid={uid}&token={token}'
         from .emails import send_email_verification
-        send_email_verification(user.email, link)
+        # Queue after commit so the worker can't look up the user (for
+        # token checks) before the row is visible
+        transaction.on_commit(lambda: send_email_verification(user.email, link))
         return user
 
 class LoginSerializer(serializers.Serializer):
@@ -45,11 +51,69 @@ class LoginSerializer(serializers.Serializer):
             raise serializers.ValidationError("Invalid credentials.")
         return {"user": user}
 
+class UserListSerializer(serializers.ListSerializer):
+    """
+    Batch path for user listings: one values() query and plain dict
+    assembly instead of instantiating a model and running the field
+    machinery per row, which dominates CPU on 50-row pages.
+    """
+
+    def to_representation(self, data):
+        request = self.context.get("request")
+        # Paginated pages arrive as plain lists, so fetch rows as dicts
+        # when we still have the queryset and read attributes otherwise
+        if isinstance(data, QuerySet):
+            rows = data.values(
+                "id", "username", "email", "role", "email_verified",
+                "display_name", "profile_picture", "bio", "stage_name",
+                "birth_date",
+            )
+        else:
+            rows = (
+                {
+                    "id": user.id,
+                    "username": user.username,
+                    "email": user.email,
+                    "role": user.role,
+                    "email_verified": user.email_verified,
+                    "display_name": user.display_name,
+                    "profile_picture": user.profile_picture.name,
+                    "bio": user.bio,
+                    "stage_name": user.stage_name,
+                    "birth_date": user.birth_date,
+                }
+                for user in data
+            )
+        results = []
+        for row in rows:
+            picture = row["profile_picture"]
+            if picture:
+                picture = settings.MEDIA_URL + picture
+                if request is not None:
+                    picture = request.build_absolute_uri(picture)
+            else:
+                picture = None
+            birth_date = row["birth_date"]
+            results.append({
+                "id": row["id"],
+                "username": row["username"],
+                "email": row["email"],
+                "role": row["role"],
+                "email_verified": row["email_verified"],
+                "display_name": row["display_name"],
+                "profile_picture": picture,
+                "bio": row["bio"],
+                "stage_name": row["stage_name"],
+                "birth_date": birth_date.isoformat() if birth_date else None,
+            })
+        return results
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "username", "email", "role", "email_verified", "display_name", "profile_picture", "bio", "stage_name", "birth_date")
         read_only_fields = ("id", "email_verified", "display_name")
+        list_serializer_class = UserListSerializer
 
 class MeSerializer(serializers.ModelSerializer):
     display_name = serializers.ReadOnlyField()
@@ -91,5 +155,6 @@ class ChangePasswordSerializer(serializers.Serializer):
     def save(self):
         user = self.context['request'].user
         user.set_password(self.validated_data['new_password'])
-        user.save()
+        # Only the password changed; keep the UPDATE to that column
+        user.save(update_fields=['password'])
         return user
@@ -0,0 +1,18 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache_key
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_auth_user(sender, instance, **kwargs):
+    """
+    Drop the cached auth user so permission-relevant changes (is_active,
+    role, email_verified) take effect on the next request instead of
+    after the cache TTL.
+    """
+    cache.delete(user_cache_key(instance.pk))
@@ -0,0 +1,19 @@
+from smtplib import SMTPException
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+
+@shared_task(autoretry_for=(SMTPException, OSError), retry_backoff=True, max_retries=5)
+def send_email_task(subject: str, body: str, email_to: str):
+    """
+    Send a single email from a Celery worker so the request thread never
+    waits on the SMTP TCP+TLS handshake. get_connection() lets the
+    worker reuse one SMTP connection when draining a batch of queued
+    sends instead of renegotiating TLS per email.
+    """
+    with get_connection() as conn:
+        EmailMessage(
+            subject, body, settings.DEFAULT_FROM_EMAIL, [email_to], connection=conn
+        ).send()
@@ -5,6 +5,7 @@ from .views import (
     VerifyEmailView, ResendVerificationView,
     ForgotPasswordView, ResetPasswordView,
     LogoutView, VerifiedOnlyView, ChangePasswordView,
+    BulkPermissionView,
 )
     
 urlpatterns = [
@@ -14,6 +15,7 @@ urlpatterns = [
     path("logout/", LogoutView.as_view(), name="logout"),
     path("me/", MeView.as_view(), name="me"),
     path("users/", UserListView.as_view(), name="user-list"),
+    path("permissions/bulk/", BulkPermissionView.as_view(), name="bulk_permissions"),
 
     path("verify-email/", VerifyEmailView.as_view(), name="verify_email"),
     path("resend-verification/", ResendVerificationView.as_view(), name="resend_verification"),
@@ -1,3 +1,5 @@
+import binascii
+
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes
 from django.contrib.auth import get_user_model
@@ -5,11 +7,34 @@ from django.contrib.auth import get_user_model
 User = get_user_model()
 
 def encode_uid(pk: int) -> str:
-    return urlsafe_base64_encode(force_bytes(str(pk)))  
+    return urlsafe_base64_encode(force_bytes(str(pk)))
 
 def decode_uid(uidb64: str):
+    # Decode and validate before touching the DB: malformed base64 or a
+    # non-integer uid is answered without a query, and the narrow except
+    # no longer swallows real database errors
     try:
-        uid = urlsafe_base64_decode(uidb64).decode()
-        return User.objects.get(pk=uid)
-    except Exception:
-        return None
\ No newline at end of file
+        pk = int(urlsafe_base64_decode(uidb64).decode())
+    except (TypeError, ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+    # Verify/reset only need the columns the token generators hash
+    # (pk/password/last_login/email/email_verified) — skip bio,
+    # profile_picture and the tsvector on this hot path. first() spares
+    # the DoesNotExist raise on the common bad-uid case
+    return User.objects.only(
+        "id", "password", "email", "email_verified", "last_login"
+    ).filter(pk=pk).first()
+
+_TIMING_DUMMY = None
+
+def timing_dummy_user():
+    """
+    Unsaved sentinel user the verify/reset views burn through the token
+    generators on their failure branches, so a request with an invalid
+    UID costs the same hash work as one with a valid UID and can't be
+    distinguished by response timing.
+    """
+    global _TIMING_DUMMY
+    if _TIMING_DUMMY is None:
+        _TIMING_DUMMY = User(pk=0, username="", email="", password="")
+    return _TIMING_DUMMY
\ No newline at end of file
@@ -1,19 +1,24 @@
 from django.contrib.auth import get_user_model
 from rest_framework import status, generics, permissions, parsers
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
 from django.conf import settings
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q
 
+from .authentication import user_cache_key
 from .serializers import (
     RegisterSerializer, LoginSerializer, MeSerializer, UserSerializer,
     ResendVerificationSerializer, ForgotPasswordSerializer, ResetPasswordSerializer,
     ChangePasswordSerializer
 )
 from .tokens import email_verification_token, password_reset_token
-from .utils import encode_uid, decode_uid
+from .utils import encode_uid, decode_uid, timing_dummy_user
 from .emails import send_email_verification, send_password_reset
 from .permissions import IsEmailVerified
 
@@ -23,6 +28,20 @@ def jwt_for_user(user):
     refresh = RefreshToken.for_user(user)
     return {"access": str(refresh.access_token), "refresh": str(refresh)}
 
+def rate_limited(request, scope, limit=10, window=60):
+    """
+    Fixed-window per-IP rate limit backed by the cache (cache.add is
+    atomic, so concurrent requests can't both start a window). Caps the
+    CPU an anonymous client can burn on the token endpoints.
+    """
+    key = f"rl:{scope}:{request.META.get('REMOTE_ADDR', '')}"
+    if cache.add(key, 1, window):
+        return False
+    try:
+        return cache.incr(key) > limit
+    except ValueError:
+        return False
+
 class RegisterView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
@@ -40,13 +59,23 @@ class MeView(generics.RetrieveUpdateAPIView):
     serializer_class = MeSerializer
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
-    
+
+    def initialize_request(self, request, *args, **kwargs):
+        # get_parsers() runs before DRF attaches the request, so pick the
+        # parser set here: the frequent dashboard GETs are body-less and
+        # don't need the multipart machinery profile updates use
+        if request.method in ('GET', 'HEAD'):
+            self.parser_classes = [parsers.JSONParser]
+        return super().initialize_request(request, *args, **kwargs)
+
     def get_object(self):
         return self.request.user
 
 class VerifyEmailView(APIView):
     permission_classes = [permissions.AllowAny]
     def get(self, request):
+        if rate_limited(request, "verify_email"):
+            return Response({"detail": "Too many attempts. Try again later."}, 429)
         uidb64 = request.query_params.get("uid")
         token = request.query_params.get("token")
         user = decode_uid(uidb64)
@@ -54,6 +83,9 @@ class VerifyEmailView(APIView):
             user.email_verified = True
             user.save(update_fields=["email_verified"])
             return Response({"detail": "Email verified successfully."}, 200)
+        if user is None:
+            # Burn equivalent hash work so invalid UIDs aren't faster
+            email_verification_token.make_token(timing_dummy_user())
         return Response({"detail": "Invalid or expired token."}, 400)
 
 class ResendVerificationView(APIView):
@@ -61,14 +93,29 @@ class ResendVerificationView(APIView):
     def post(self, request):
         ser = ResendVerificationSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
-        try:
-            user = User.objects.get(email=ser.validated_data["email"])
-        except User.DoesNotExist:
+        email = ser.validated_data["email"]
+        # One email per address per minute, keyed on the submitted
+        # address before the lookup so the limiter can't be used to
+        # probe which emails exist; also skips the DB entirely on spam
+        if not cache.add(f"rl:verif:{email.lower()}", 1, 60):
+            return Response({"detail": "Please wait before requesting another email."}, 429)
+        # iexact rides the Lower(email) index; only() keeps the fetch to
+        # the columns the token hash needs
+        user = User.objects.filter(
+            email__iexact=email
+        ).only("id", "email", "email_verified").first()
+        if user is None:
             # For privacy, return success anyway
             return Response({"detail": "If an account exists, a verification email has been sent."}, 200)
-        uid = encode_uid(user.pk)
-        token = email_verification_token.make_token(user)
-        link = f'{settings.FRONTEND_BASE_URL}/verify-email?uid={uid}&token={token}'
+        # Tokens are minute-granular, so the computed link is reusable
+        # across burst resends
+        link_key = f"verif_link:{user.pk}"
+        link = cache.get(link_key)
+        if link is None:
+            uid = encode_uid(user.pk)
+            token = email_verification_token.make_token(user)
+            link = f'{settings.FRONTEND_BASE_URL}/verify-email?uid={uid}&token={token}'
+            cache.set(link_key, link, 60)
         send_email_verification(user.email, link)
         return Response({"detail": "Verification email sent."}, 200)
 
@@ -78,27 +125,42 @@ class ForgotPasswordView(APIView):
         ser = ForgotPasswordSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         email = ser.validated_data["email"]
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        # Same pre-lookup mailbomb guard as ResendVerificationView
+        if not cache.add(f"rl:reset:{email.lower()}", 1, 60):
+            return Response({"detail": "Please wait before requesting another email."}, 429)
+        # The built-in reset token hashes pk/password/last_login/email,
+        # so fetch exactly those columns
+        user = User.objects.filter(email__iexact=email).only(
+            "id", "email", "password", "last_login"
+        ).first()
+        if user is None:
             return Response({"detail": "If an account exists, password reset was sent."}, 200)
-        uid = encode_uid(user.pk)
-        token = password_reset_token.make_token(user)
-        link = f'{settings.FRONTEND_BASE_URL}/reset-password?uid={uid}&token={token}'
+        link_key = f"reset_link:{user.pk}"
+        link = cache.get(link_key)
+        if link is None:
+            uid = encode_uid(user.pk)
+            token = password_reset_token.make_token(user)
+            link = f'{settings.FRONTEND_BASE_URL}/reset-password?uid={uid}&token={token}'
+            cache.set(link_key, link, 60)
         send_password_reset(email, link)
         return Response({"detail": "If an account exists, password reset was sent."}, 200)
 
 class ResetPasswordView(APIView):
     permission_classes = [permissions.AllowAny]
     def post(self, request):
+        if rate_limited(request, "reset_password"):
+            return Response({"detail": "Too many attempts. Try again later."}, 429)
         ser = ResetPasswordSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         user = decode_uid(ser.validated_data["uid"])
         token = ser.validated_data["token"]
         if not user or not password_reset_token.check_token(user, token):
+            if user is None:
+                # Burn equivalent hash work so invalid UIDs aren't faster
+                password_reset_token.make_token(timing_dummy_user())
             return Response({"detail": "Invalid or expired token."}, 400)
         user.set_password(ser.validated_data["new_password"])
-        user.save()
+        user.save(update_fields=["password"])
         return Response({"detail": "Password reset successfully."}, 200)
 
 class LogoutView(APIView):
@@ -110,33 +172,97 @@ class LogoutView(APIView):
             if refresh_token:
                 token = RefreshToken(refresh_token)
                 token.blacklist()
-            # Also blacklist all outstanding tokens for this user
-            tokens = OutstandingToken.objects.filter(user=request.user)
-            for token in tokens:
-                BlacklistedToken.objects.get_or_create(token=token)
+            # Blacklist all outstanding tokens in one INSERT instead of
+            # a SELECT+INSERT pair per token
+            with transaction.atomic():
+                outstanding_ids = OutstandingToken.objects.filter(
+                    user=request.user
+                ).values_list('id', flat=True)
+                BlacklistedToken.objects.bulk_create(
+                    [BlacklistedToken(token_id=token_id) for token_id in outstanding_ids],
+                    ignore_conflicts=True,
+                    batch_size=500,
+                )
+            # Logged-out users shouldn't be served from the auth cache
+            cache.delete(user_cache_key(request.user.id))
             return Response({"detail": "Successfully logged out."}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"detail": "Logout failed."}, status=status.HTTP_400_BAD_REQUEST)
 
+class BulkPermissionView(APIView):
+    """
+    One-shot permission matrix for list UIs: instead of N per-object
+    requests to learn which edit/delete buttons to show, the client
+    posts {"resource_type": "song", "ids": [...]} and gets back
+    {id: {"edit": bool, "delete": bool}} computed from a single
+    IN (...) query over the owner FK column.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        # Deferred import: songs.views imports from this app at startup
+        from songs.models import AIPrompt, Album, Comment, Playlist, Song
+        owner_fields = {
+            'song': (Song, 'artist_id'),
+            'album': (Album, 'artist_id'),
+            'playlist': (Playlist, 'user_id'),
+            'comment': (Comment, 'user_id'),
+            'aiprompt': (AIPrompt, 'user_id'),
+        }
+        entry = owner_fields.get(request.data.get('resource_type'))
+        if entry is None:
+            return Response({"detail": "Unknown resource_type."}, 400)
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response({"detail": "ids must be a list of integers."}, 400)
+        model, owner_field = entry
+        # Bound the IN list; list pages never show anywhere near this many
+        user_id = request.user.id
+        matrix = {}
+        for obj_id, owner_id in model.objects.filter(
+            id__in=ids[:500]
+        ).values_list('id', owner_field):
+            allowed = owner_id == user_id
+            matrix[obj_id] = {"edit": allowed, "delete": allowed}
+        return Response(matrix, 200)
+
 # Example of a protected view that requires verified email
 class VerifiedOnlyView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsEmailVerified]
     def get(self, request):
         return Response({"detail": "You are verified and authenticated."}, 200)
 
+class UserListPagination(PageNumberPagination):
+    page_size = 50
+
+
 class UserListView(generics.ListAPIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = UserListPagination
 
     def get_queryset(self):
-        queryset = User.objects.all()
+        # Project down to the serializer's columns — the full row drags
+        # in password hash, bio-sized text and the tsvector column.
+        queryset = User.objects.only(
+            'username', 'email', 'role', 'email_verified', 'display_name',
+            'profile_picture', 'bio', 'stage_name', 'birth_date',
+        ).order_by('id')
         search = self.request.query_params.get('search')
         if search:
-            queryset = queryset.filter(
+            # Whole-word hits come from the generated tsvector via its
+            # GIN index; the icontains arms keep substring matches
+            # working (served by the trigram GIN indexes) and catch
+            # partial tokens FTS can't
+            search_query = SearchQuery(search, config='simple')
+            queryset = queryset.annotate(
+                search_rank=SearchRank(F('search_vector'), search_query)
+            ).filter(
+                Q(search_vector=search_query) |
                 Q(username__icontains=search) |
                 Q(stage_name__icontains=search) |
                 Q(email__icontains=search)
-            )
+            ).order_by('-search_rank', 'id')
         return queryset
 
 class ChangePasswordView(APIView):